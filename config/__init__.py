@@ -0,0 +1,61 @@
+"""Config directory (the *.yaml files) and the shared cached YAML loader.
+
+Both ingestion and ranking read their config through load_yaml_cached, so
+it lives here rather than in either layer.
+"""
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# path -> (mtime, size, parsed YAML, values derived from it); least
+# recently used first
+_yaml_cache: OrderedDict[str, tuple[float, int, object, dict]] = OrderedDict()
+_YAML_CACHE_SIZE = 32
+
+
+def load_yaml_cached(path: str):
+    """Parse a YAML file, reusing the last parse while its mtime and size are unchanged.
+
+    The digest loads the same config files for every event it scores and
+    explains, and ingestion reads sources.yaml and venues.yaml through it
+    too. The parsed object is shared between callers, so treat it as
+    read-only.
+    """
+    st = os.stat(path)
+    cached = _yaml_cache.get(path)
+    if cached and cached[:2] == (st.st_mtime, st.st_size):
+        _yaml_cache.move_to_end(path)
+        return cached[2]
+    with open(path) as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    _yaml_cache[path] = (st.st_mtime, st.st_size, data, {})
+    _yaml_cache.move_to_end(path)
+    if len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+    return data
+
+
+def derive_cached(data, key: str, build):
+    """Return build(), computed once per parse if `data` came from load_yaml_cached.
+
+    The result is stored with the cache entry that holds `data`, so it is
+    dropped on the same mtime+size change that triggers a reparse. For any
+    other object (e.g. a dict built in a test) build() is just called.
+    """
+    for entry in _yaml_cache.values():
+        if entry[2] is data:
+            derived = entry[3]
+            if key not in derived:
+                derived[key] = build()
+            return derived[key]
+    return build()
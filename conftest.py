@@ -0,0 +1,2 @@
+"""Root conftest: its presence puts the project root on sys.path for tests,
+so test modules import db/ingestion/ranking/digest directly."""
@@ -6,6 +6,7 @@ from html import escape
 from math import ceil
 
 from ranking.explainer import match_reasons
+from ranking.scorer import event_artist_names
 
 # SVG icons (from Lucide, matching the Figma design)
 _ICON_DISC = '<svg class="nav-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"/><circle cx="12" cy="12" r="3"/></svg>'
@@ -53,18 +54,18 @@ def _format_lead_time(event) -> str:
     return f"in {weeks} weeks"
 
 
-def _get_match_reasons(event, scores, prefs=None, venues=None) -> list[str]:
+def _get_match_reasons(event, scores) -> list[str]:
     if "signals" not in scores:
         return ["New discovery"]
-    return match_reasons(event, scores, prefs, venues)
+    return match_reasons(event, scores)
 
 
-def _render_event_card(event, scores, prefs=None, venues=None, lead_time: str = "") -> str:
+def _render_event_card(event, scores, lead_time: str = "") -> str:
     price = _format_price(event)
     time = _format_time(event)
     day = _format_day(event)
     total = round(scores.get("total", 0))
-    reasons = _get_match_reasons(event, scores, prefs, venues)
+    reasons = _get_match_reasons(event, scores)
     match_text = " + ".join(reasons)
 
     title = escape(event.title)
@@ -134,15 +135,12 @@ def _sidebar_html(active_page: str) -> str:
   </nav>"""
 
 
-def _event_to_json(event, scores, prefs=None, venues=None) -> dict:
-    reasons = _get_match_reasons(event, scores, prefs, venues)
-    artists = []
+def _event_to_json(event, scores) -> dict:
+    reasons = _get_match_reasons(event, scores)
     try:
-        for ent in event.entities:
-            if ent.entity_type == "artist":
-                artists.append(ent.entity_value)
+        artists = list(event_artist_names(event))
     except Exception:
-        pass
+        artists = []
 
     start_iso = event.start_dt.isoformat() if hasattr(event.start_dt, "isoformat") else str(event.start_dt)
     return {
@@ -170,15 +168,8 @@ def render_web(radar_events: list[tuple], output_dir: str = None, prefs: dict =
     cards_html = ""
     radar_json_list = []
     for ev, scores in radar_events:
-        cards_html += _render_event_card(ev, scores, prefs, venues, lead_time=_format_lead_time(ev))
-        try:
-            entities = ev._prefetched_entities if hasattr(ev, "_prefetched_entities") else list(ev.entities)
-            original = ev.entities
-            ev.entities = entities
-            radar_json_list.append(_event_to_json(ev, scores, prefs, venues))
-            ev.entities = original
-        except Exception:
-            radar_json_list.append(_event_to_json(ev, scores, prefs, venues))
+        cards_html += _render_event_card(ev, scores, lead_time=_format_lead_time(ev))
+        radar_json_list.append(_event_to_json(ev, scores))
 
     radar_json_str = json.dumps(radar_json_list, ensure_ascii=False)
 
@@ -228,14 +219,7 @@ def render_full_list(full_list_data: list[tuple], output_dir: str = None, prefs:
     # Build JSON data for all events
     events_json = []
     for ev, scores in full_list_data:
-        try:
-            entities = ev._prefetched_entities if hasattr(ev, "_prefetched_entities") else list(ev.entities)
-            original = ev.entities
-            ev.entities = entities
-            events_json.append(_event_to_json(ev, scores, prefs, venues))
-            ev.entities = original
-        except Exception:
-            events_json.append(_event_to_json(ev, scores, prefs, venues))
+        events_json.append(_event_to_json(ev, scores))
 
     json_str = json.dumps(events_json, ensure_ascii=False)
     sidebar = _sidebar_html("list")
@@ -302,14 +286,7 @@ def render_lucky_dip(lucky_dip_data: list[tuple], output_dir: str = None, prefs:
 
     events_json = []
     for ev, scores in lucky_dip_data:
-        try:
-            entities = ev._prefetched_entities if hasattr(ev, "_prefetched_entities") else list(ev.entities)
-            original = ev.entities
-            ev.entities = entities
-            events_json.append(_event_to_json(ev, scores, prefs, venues))
-            ev.entities = original
-        except Exception:
-            events_json.append(_event_to_json(ev, scores, prefs, venues))
+        events_json.append(_event_to_json(ev, scores))
 
     json_str = json.dumps(events_json, ensure_ascii=False)
     sidebar = _sidebar_html("lucky")
@@ -2,14 +2,62 @@
 from __future__ import annotations
 
 import abc
+import functools
 import hashlib
 import json
 import logging
+import re
+import sys
 from datetime import datetime
 from typing import Any
 
+try:
+    # Optional C parser, faster than fromisoformat; same ValueError contract
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
 logger = logging.getLogger(__name__)
 
+JSON_LD_RE = re.compile(
+    r"""<script[^>]*type=["']application/ld\+json["'][^>]*>(.*?)</script>""",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Schema.org @type values treated as events in JSON-LD
+JSON_LD_EVENT_TYPES = frozenset({"Event", "MusicEvent", "TheaterEvent",
+                                 "DanceEvent", "ExhibitionEvent", "SocialEvent"})
+
+
+def json_ld_blocks(html: str) -> list[str]:
+    """Return the raw text of every <script type="application/ld+json"> block.
+
+    A regex scan avoids building a BeautifulSoup tree when JSON-LD is all a
+    caller needs. BeautifulSoup is only used if the page mentions JSON-LD more
+    often than the regex matched (e.g. an unquoted type attribute).
+    """
+    blocks = JSON_LD_RE.findall(html)
+    if html.count("application/ld+json") > len(blocks):
+        from bs4 import BeautifulSoup, SoupStrainer
+        strainer = SoupStrainer("script", attrs={"type": "application/ld+json"})
+        soup = BeautifulSoup(html, "html.parser", parse_only=strainer)
+        # Plain str, not NavigableString: orjson.loads rejects str subclasses
+        blocks = [str(tag.string) for tag in soup.find_all("script") if tag.string]
+    return blocks
+
+
+def artist_entity(name) -> dict:
+    """Return the entity dict for an artist.
+
+    Residencies and multi-night runs repeat the same performers, so string
+    names are interned and repeats share one str. Each call gets its own
+    dict, and non-str names (raw JSON can hold a dict or list where a name
+    should be) are passed through as before.
+    """
+    if type(name) is str:
+        name = sys.intern(name)
+    return {"type": "artist", "value": name}
+
 
 class EventDict(dict):
     """Thin wrapper for validated event data before DB insertion."""
@@ -60,32 +108,60 @@ class BaseAdapter(abc.ABC):
 
     @staticmethod
     def make_event_id(source_name: str, unique_part: str) -> str:
-        """Generate a deterministic source_event_id."""
+        """Generate a deterministic source_event_id.
+
+        Deliberately a readable concatenation rather than a digest: it is
+        cheaper than any hash, and stored ids must stay stable because
+        (source, source_event_id) is the upsert key in store_events.
+        """
         return f"{source_name}:{unique_part}"
 
     @staticmethod
     def parse_datetime(dt_str: str, fmt: str = None) -> datetime | None:
-        """Try to parse a datetime string with common formats."""
+        """Try to parse a datetime string with common formats.
+
+        ISO-8601 strings (the usual JSON-LD startDate) take a fast path
+        (ciso8601 if installed, else fromisoformat) before the strptime
+        ladder. A trailing "Z" is dropped so, as with the ladder's "...Z"
+        formats, the result stays naive. Results are memoized per string,
+        since listing pages and feeds repeat the same dates.
+        """
         if isinstance(dt_str, datetime):
             return dt_str
-        if not dt_str:
+        if not dt_str or not isinstance(dt_str, str):
             return None
-        formats = [fmt] if fmt else [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%S.%f%z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d",
-            "%m/%d/%Y %I:%M %p",
-            "%B %d, %Y %I:%M %p",
-            "%b %d, %Y",
-        ]
-        for f in formats:
-            try:
-                return datetime.strptime(dt_str.strip(), f)
-            except (ValueError, AttributeError):
-                continue
-        return None
+        return _parse_datetime_str(dt_str, fmt)
+
+
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%m/%d/%Y %I:%M %p",
+    "%B %d, %Y %I:%M %p",
+    "%b %d, %Y",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_str(dt_str: str, fmt: str | None) -> datetime | None:
+    """String path of BaseAdapter.parse_datetime (datetimes are immutable,
+    so cached results are safe to share)."""
+    s = dt_str.strip()
+    if not fmt and len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        iso = s[:-1] if s[-1] == "Z" and "T" in s else s
+        try:
+            return _parse_iso(iso)
+        except ValueError:
+            pass
+    for f in (fmt,) if fmt else DATETIME_FORMATS:
+        try:
+            return datetime.strptime(s, f)
+        except ValueError:
+            continue
+    return None
@@ -9,20 +9,29 @@ Given a URL, this module:
 """
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import os
 import re
+import sys
 import time
 from datetime import datetime
 from typing import Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 
+import orjson
 import requests
 import yaml
 from bs4 import BeautifulSoup
 
-from ingestion.base import BaseAdapter, EventDict
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+from ingestion.base import (
+    JSON_LD_EVENT_TYPES, BaseAdapter, EventDict, artist_entity, json_ld_blocks,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,17 +46,57 @@ HEADERS = {
 
 FETCH_DELAY = 2  # seconds between fetches, to be polite
 
+# classify_page only parses pages that have links or an og:site_name tag;
+# otherwise a <title> tag is all it looks for
+_TREE_HINT_RE = re.compile(r"href|og:site_name", re.I)
+_TITLE_TAG_RE = re.compile(r"<title[\s/>]", re.I)
+
+# Category for a JSON-LD event, by @type
+JSONLD_CATEGORIES = {
+    "MusicEvent": "concert", "TheaterEvent": "theatre",
+    "ExhibitionEvent": "exhibition",
+}
+
+# Event-like link paths on listing pages, checked once per anchor
+EVENT_LINK_RE = re.compile(
+    r"/(events?|shows?|performances?|concerts?|tickets?|calendar)/[^/]+", re.I)
+
+
+@functools.lru_cache(maxsize=4)
+def _soup(html: str) -> BeautifulSoup:
+    """Parse a page once for classify_page, _opengraph_to_event and
+    derive_calendar_url, which process_link all runs on the same HTML.
+
+    Cached trees are shared, so callers must not modify them.
+    """
+    return BeautifulSoup(html, "html.parser")
+
 
 # ---------------------------------------------------------------------------
 # Link file I/O
 # ---------------------------------------------------------------------------
 
+def _write_yaml(path: str, data, header: str = ""):
+    """Dump `data` (after `header`) to `path` in one write.
+
+    The YAML is rendered in memory, written to a temp file next to `path`
+    and moved into place with os.replace, so readers (including a concurrent
+    ingest run) never see a half-written config file.
+    """
+    body = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False,
+                     sort_keys=False, allow_unicode=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(header + body)
+    os.replace(tmp, path)
+
+
 def load_discovered_links() -> list[dict]:
     path = os.path.join(CONFIG_DIR, "discovered_links.yaml")
     if not os.path.exists(path):
         return []
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=YamlLoader) or {}
     return data.get("links", []) or []
 
 
@@ -65,10 +114,7 @@ def save_discovered_links(links: list[dict]):
             break
     header = "\n".join(header_lines)
 
-    data = {"links": links}
-    body = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
-    with open(path, "w") as f:
-        f.write(header + "\n" + body)
+    _write_yaml(path, {"links": links}, header=header + "\n")
 
 
 def add_link(url: str, note: str = "") -> dict:
@@ -114,7 +160,9 @@ def classify_page(url: str, html: str) -> dict:
       - ics_url: str, the ICS feed URL if found
       - event_links: list of event-like links found on the page
     """
-    soup = BeautifulSoup(html, "html.parser")
+    # Only links and og:site_name need a parsed tree; pages with neither
+    # skip the parse (JSON-LD is read with a regex scan anyway)
+    soup = _soup(html) if _TREE_HINT_RE.search(html) else None
     result = {
         "type": "unknown",
         "json_ld": [],
@@ -124,35 +172,39 @@ def classify_page(url: str, html: str) -> dict:
         "venue_name": None,
     }
 
-    # 1. Check for JSON-LD
-    event_types = {"Event", "MusicEvent", "TheaterEvent",
-                   "DanceEvent", "ExhibitionEvent", "SocialEvent"}
-    for script_tag in soup.find_all("script", type="application/ld+json"):
+    # 1. Check for JSON-LD. Every event @type ends in "Event", so blocks
+    # without that substring (Organization, BreadcrumbList, ...) aren't decoded
+    for block in json_ld_blocks(html):
+        if "Event" not in block:
+            continue
         try:
-            data = json.loads(script_tag.string)
-        except (json.JSONDecodeError, TypeError):
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
             continue
         items = data if isinstance(data, list) else [data]
         for item in items:
-            if item.get("@type") in event_types:
+            if item.get("@type") in JSON_LD_EVENT_TYPES:
                 result["json_ld"].append(item)
 
-    # 2. Check for ICS feed
-    for link in soup.find_all(["a", "link"], href=True):
-        href = link.get("href", "")
-        if href.endswith(".ics") or "ical" in href.lower() or "webcal" in href.lower():
-            result["has_ics"] = True
-            result["ics_url"] = urljoin(url, href)
-            break
-
-    # 3. Look for event-like links (for calendar pages)
-    # Derive a link pattern from the listing page URL itself:
-    # if we're on /shows, look for /shows/something links
+    # 2 + 3. One walk over a/link hrefs finds both the first ICS feed link
+    # and event-like links (for calendar pages). Event links are derived
+    # from the listing page URL itself: if we're on /shows, look for
+    # /shows/something links
     parsed_url = urlparse(url)
     listing_path = parsed_url.path.rstrip("/")
     listing_host = parsed_url.netloc
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    listing_child = listing_path + "/"
+    event_links = {}
+    links = soup.find_all(["a", "link"], href=True) if soup is not None else ()
+    for link in links:
+        href = link["href"]
+        if not result["has_ics"]:
+            href_lower = href.lower()
+            if href.endswith(".ics") or "ical" in href_lower or "webcal" in href_lower:
+                result["has_ics"] = True
+                result["ics_url"] = urljoin(url, href)
+        if link.name != "a":
+            continue
         full_url = urljoin(url, href)
         parsed_href = urlparse(full_url)
         href_path = parsed_href.path
@@ -162,22 +214,22 @@ def classify_page(url: str, html: str) -> dict:
         if "format=ical" in full_url or href_path.endswith(".ics"):
             continue
         # Match links that are children of the listing path (same domain)
-        if listing_path and href_path.startswith(listing_path + "/") and href_path != listing_path + "/":
-            clean = full_url.split("?")[0].split("#")[0]
-            if clean not in result["event_links"]:
-                result["event_links"].append(clean)
+        if listing_path and href_path.startswith(listing_child) and href_path != listing_child:
+            event_links[full_url.split("?")[0].split("#")[0]] = None
         # Also match general event-like path patterns
-        elif re.search(r"/(events?|shows?|performances?|concerts?|tickets?|calendar)/[^/]+", href, re.I):
-            clean = full_url.split("?")[0].split("#")[0]
-            if clean not in result["event_links"]:
-                result["event_links"].append(clean)
+        elif EVENT_LINK_RE.search(href):
+            event_links[full_url.split("?")[0].split("#")[0]] = None
+
+    # Insertion-ordered dict keys dedupe without rescanning the list per link
+    result["event_links"] = list(event_links)
 
     # 4. Try to extract venue name from the page
     # Check og:site_name, then <title>
-    og_site = soup.find("meta", property="og:site_name")
+    og_site = soup.find("meta", property="og:site_name") if soup is not None else None
+    has_title = soup.title if soup is not None else _TITLE_TAG_RE.search(html)
     if og_site:
         result["venue_name"] = og_site.get("content", "").strip()
-    elif soup.title:
+    elif has_title:
         # Use domain-derived name as fallback
         parsed = urlparse(url)
         domain = parsed.netloc.replace("www.", "")
@@ -248,6 +300,9 @@ def _jsonld_to_event(item: dict, source_name: str) -> EventDict | None:
     else:
         venue_name = str(location) if location else "Unknown Venue"
         address = ""
+    # A page repeats its venue on every event; share one string
+    if type(venue_name) is str:
+        venue_name = sys.intern(venue_name)
 
     # Performers
     entities = []
@@ -256,9 +311,9 @@ def _jsonld_to_event(item: dict, source_name: str) -> EventDict | None:
         performers = [performers]
     for perf in performers:
         if isinstance(perf, dict) and perf.get("name"):
-            entities.append({"type": "artist", "value": perf["name"]})
+            entities.append(artist_entity(perf["name"]))
         elif isinstance(perf, str) and perf:
-            entities.append({"type": "artist", "value": perf})
+            entities.append(artist_entity(perf))
 
     # Price
     offers = item.get("offers", {})
@@ -270,11 +325,7 @@ def _jsonld_to_event(item: dict, source_name: str) -> EventDict | None:
     ticket_url = item.get("url", "")
 
     # Category from @type
-    type_to_cat = {
-        "MusicEvent": "concert", "TheaterEvent": "theatre",
-        "ExhibitionEvent": "exhibition",
-    }
-    category = type_to_cat.get(item.get("@type", ""), "")
+    category = JSONLD_CATEGORIES.get(item.get("@type", ""), "")
 
     event_id = BaseAdapter.make_event_id(
         source_name, f"{venue_name}:{start_str}:{title[:30]}"
@@ -299,7 +350,7 @@ def _jsonld_to_event(item: dict, source_name: str) -> EventDict | None:
 
 def _opengraph_to_event(html: str, url: str, source_name: str) -> EventDict | None:
     """Try to extract an event from OpenGraph meta tags."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
 
     def og(prop):
         tag = soup.find("meta", property=f"og:{prop}")
@@ -352,7 +403,7 @@ def _opengraph_to_event(html: str, url: str, source_name: str) -> EventDict | No
 def derive_calendar_url(url: str, html: str) -> str | None:
     """From a single event URL, try to find the venue's calendar page."""
     parsed = urlparse(url)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
 
     # 1. Look for explicit calendar/events links
     for a in soup.find_all("a", href=True):
@@ -427,28 +478,27 @@ def probe_source(url: str) -> dict | None:
     return None
 
 
+_NON_NAME_CHARS_RE = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def source_name_from_url(url: str) -> str:
     """Generate a source name from a URL."""
-    parsed = urlparse(url)
-    domain = parsed.netloc.replace("www.", "")
+    domain = urlsplit(url).netloc.replace("www.", "")
     name = domain.split(".")[0]
-    # Clean up: lowercase, underscores
-    name = re.sub(r"[^a-z0-9]", "_", name.lower())
-    name = re.sub(r"_+", "_", name).strip("_")
-    return name
+    # Clean up: lowercase, runs of other characters become one underscore
+    return _NON_NAME_CHARS_RE.sub("_", name.lower()).strip("_")
 
 
 def load_sources_config() -> list[dict]:
     path = os.path.join(CONFIG_DIR, "sources.yaml")
     with open(path) as f:
-        return yaml.safe_load(f)["sources"]
+        return yaml.load(f, Loader=YamlLoader)["sources"]
 
 
 def save_sources_config(sources: list[dict]):
     path = os.path.join(CONFIG_DIR, "sources.yaml")
-    with open(path, "w") as f:
-        yaml.dump({"sources": sources}, f, default_flow_style=False,
-                  sort_keys=False, allow_unicode=True)
+    _write_yaml(path, {"sources": sources})
 
 
 def register_source(url: str, name: str, extraction_config: dict,
@@ -518,7 +568,7 @@ def _update_venue_boosts(venues: set):
     """Add new venues to preferences.yaml with a default boost."""
     path = os.path.join(CONFIG_DIR, "preferences.yaml")
     with open(path) as f:
-        prefs = yaml.safe_load(f) or {}
+        prefs = yaml.load(f, Loader=YamlLoader) or {}
 
     existing = prefs.get("venue_boost", {})
     added = []
@@ -530,9 +580,7 @@ def _update_venue_boosts(venues: set):
 
     if added:
         prefs["venue_boost"] = existing
-        with open(path, "w") as f:
-            yaml.dump(prefs, f, default_flow_style=False, sort_keys=False,
-                      allow_unicode=True)
+        _write_yaml(path, prefs)
         logger.info(f"Added venue boosts: {added}")
 
 
@@ -542,7 +590,7 @@ def _update_artist_affinities(artists: set):
     with open(path) as f:
         content = f.read()
 
-    data = yaml.safe_load(content) or {}
+    data = yaml.load(content, Loader=YamlLoader) or {}
     existing = data.get("artist_affinities", {})
     if existing is None:
         existing = {}
@@ -555,9 +603,7 @@ def _update_artist_affinities(artists: set):
 
     if added:
         data["artist_affinities"] = existing
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False,
-                      allow_unicode=True)
+        _write_yaml(path, data)
         logger.info(f"Added artist affinities: {added}")
 
 
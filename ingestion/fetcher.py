@@ -0,0 +1,99 @@
+"""HTML fetching for scrape adapters, routed per host.
+
+Pages are fetched over plain HTTP by default. When a host's static HTML
+parses to zero events and looks like a JS shell (small page), the host is
+remembered in JS_HOSTS_PATH and fetched through the shared headless browser,
+so Playwright's cost is only paid for sites that need it. A mark is dropped
+if the browser finds no events either (the page was just empty), and it
+expires after JS_HOST_TTL so the host is re-probed over plain HTTP.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+JS_HOSTS_PATH = os.environ.get("JS_HOSTS_PATH", "data/js_hosts.json")
+
+# Static pages this large probably hold real content even if nothing parsed,
+# so they aren't switched over to the browser.
+JS_SHELL_MAX_CHARS = 50_000
+
+# How long a host stays marked before plain HTTP is tried again
+JS_HOST_TTL = 14 * 24 * 3600  # seconds
+
+# host -> time it was marked
+_js_hosts: dict[str, float] | None = None
+
+
+def _load_js_hosts() -> dict[str, float]:
+    global _js_hosts
+    if _js_hosts is None:
+        try:
+            with open(JS_HOSTS_PATH) as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        _js_hosts = {host: marked for host, marked in data.items()
+                     if isinstance(marked, (int, float))}
+    return _js_hosts
+
+
+def _save_js_hosts(hosts: dict[str, float]):
+    os.makedirs(os.path.dirname(JS_HOSTS_PATH) or ".", exist_ok=True)
+    tmp = JS_HOSTS_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(hosts, f, indent=2, sort_keys=True)
+    os.replace(tmp, JS_HOSTS_PATH)
+
+
+def needs_js(url: str) -> bool:
+    """True if this URL's host is marked as needing JS rendering and the
+    mark hasn't expired."""
+    marked = _load_js_hosts().get(urlparse(url).netloc)
+    return marked is not None and time.time() - marked < JS_HOST_TTL
+
+
+def mark_needs_js(url: str, html) -> bool:
+    """Mark the host as needing JS if `html` looks like an unrendered shell.
+
+    Called after a static fetch parsed to zero events. Returns True if the
+    host was newly marked, i.e. a browser refetch is worth trying.
+    """
+    if needs_js(url) or not isinstance(html, str) or len(html) >= JS_SHELL_MAX_CHARS:
+        return False
+
+    host = urlparse(url).netloc
+    hosts = _load_js_hosts()
+    hosts[host] = time.time()
+    _save_js_hosts(hosts)
+    logger.info(f"Marked {host} as needing JS rendering")
+    return True
+
+
+def unmark_needs_js(url: str):
+    """Drop the host's JS mark, e.g. when the browser retry found no events
+    or failed."""
+    host = urlparse(url).netloc
+    hosts = _load_js_hosts()
+    if hosts.pop(host, None) is not None:
+        _save_js_hosts(hosts)
+        logger.info(f"Unmarked {host}: browser retry found no events")
+
+
+def fetch_html(url: str, headers: dict = None, timeout: int = 30) -> str:
+    """Fetch a page over HTTP, or via headless browser for JS-marked hosts."""
+    if needs_js(url):
+        from ingestion.playwright_adapter import fetch_with_playwright
+        return fetch_with_playwright(url)
+    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return resp.text
@@ -1,4 +1,5 @@
 """Generic JSON API fetcher."""
+import orjson
 import requests
 
 from ingestion.base import BaseAdapter
@@ -10,4 +11,4 @@ class JSONAPIAdapter(BaseAdapter):
     def fetch_json(self, url: str, params: dict = None, headers: dict = None) -> dict:
         resp = requests.get(url, params=params, headers=headers, timeout=30)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
@@ -1,31 +1,54 @@
 """Playwright-based scraper for JavaScript-rendered sites."""
 from __future__ import annotations
 
+import atexit
+
 from bs4 import BeautifulSoup
 
 from ingestion.base import BaseAdapter
 
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# One headless Chromium per process, launched on first use and reused by
+# every fetch; each fetch still gets its own fresh context via new_page().
+_playwright = None
+_browser = None
+
+
+def _shared_browser():
+    global _playwright, _browser
+    if _browser is None:
+        from playwright.sync_api import sync_playwright
+
+        _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(headless=True)
+        atexit.register(_close_shared_browser)
+    return _browser
+
+
+def _close_shared_browser():
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _playwright.stop()
+        _browser = _playwright = None
+
 
 def fetch_with_playwright(url: str, wait_for: str = "networkidle",
                           timeout: int = 15000, extra_wait: int = 2000) -> str:
     """Standalone function to fetch a URL with Playwright headless browser."""
-    from playwright.sync_api import sync_playwright
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(
-            user_agent=(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        )
-        try:
-            page.goto(url, wait_until=wait_for, timeout=timeout)
-            page.wait_for_timeout(extra_wait)
-            html = page.content()
-        finally:
-            browser.close()
+    page = _shared_browser().new_page(user_agent=USER_AGENT)
+    try:
+        page.goto(url, wait_until=wait_for, timeout=timeout)
+        page.wait_for_timeout(extra_wait)
+        html = page.content()
+    finally:
+        # Closing the page also closes the context new_page() created for it
+        page.close()
     return html
 
 
@@ -42,29 +65,9 @@ class PlaywrightAdapter(BaseAdapter):
 
     def fetch_html(self, url: str = None) -> str:
         """Fetch a URL using Playwright headless browser."""
-        from playwright.sync_api import sync_playwright
-
-        target_url = url or self.url
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            )
-            try:
-                page.goto(target_url, wait_until=self.WAIT_FOR,
-                          timeout=self.WAIT_TIMEOUT)
-                # Extra wait for JS rendering to complete
-                page.wait_for_timeout(self.EXTRA_WAIT)
-                html = page.content()
-            finally:
-                browser.close()
-
-        return html
+        return fetch_with_playwright(url or self.url, wait_for=self.WAIT_FOR,
+                                     timeout=self.WAIT_TIMEOUT,
+                                     extra_wait=self.EXTRA_WAIT)
 
     def soup(self, html: str) -> BeautifulSoup:
         return BeautifulSoup(html, "html.parser")
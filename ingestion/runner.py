@@ -3,12 +3,13 @@ import importlib
 import json
 import logging
 import os
+import re
 import time
 from datetime import datetime
 
-import yaml
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
+from config import load_yaml_cached
 from db.models import Source, Event, EventEntity, init_db
 from ingestion.base import BaseAdapter
 
@@ -18,15 +19,13 @@ CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "config")
 
 
 def load_sources_config() -> list[dict]:
-    path = os.path.join(CONFIG_DIR, "sources.yaml")
-    with open(path) as f:
-        return yaml.safe_load(f)["sources"]
+    """Sources from sources.yaml. Shared via load_yaml_cached: read-only."""
+    return load_yaml_cached(os.path.join(CONFIG_DIR, "sources.yaml"))["sources"]
 
 
 def load_venues_config() -> dict:
-    path = os.path.join(CONFIG_DIR, "venues.yaml")
-    with open(path) as f:
-        return yaml.safe_load(f).get("venues", {})
+    """Venues from venues.yaml. Shared via load_yaml_cached: read-only."""
+    return load_yaml_cached(os.path.join(CONFIG_DIR, "venues.yaml")).get("venues", {})
 
 
 def get_adapter(source_cfg: dict) -> BaseAdapter:
@@ -118,13 +117,13 @@ def store_events(source: Source, events: list[dict], raw_payload=None):
     return stored
 
 
+_TITLE_PUNCT_RE = re.compile(r"[^\w\s]+")
+_TITLE_SPACE_RE = re.compile(r"\s+")
+
+
 def normalize_title(title: str) -> str:
     """Normalize title for dedup comparison."""
-    import re
-    t = title.lower().strip()
-    t = re.sub(r"[^\w\s]", "", t)
-    t = re.sub(r"\s+", " ", t)
-    return t
+    return _TITLE_SPACE_RE.sub(" ", _TITLE_PUNCT_RE.sub("", title.lower().strip()))
 
 
 def deduplicate_events():
@@ -134,10 +133,15 @@ def deduplicate_events():
     events = list(Event.select().where(Event.status == "active").order_by(Event.start_dt))
     merged = 0
 
+    # Normalize each title and venue once, not once per pair
+    titles = [normalize_title(ev.title) for ev in events]
+    venues = [ev.venue_name.lower() for ev in events]
+
     for i, ev1 in enumerate(events):
         if ev1.status != "active":
             continue
-        for ev2 in events[i + 1:]:
+        for j in range(i + 1, len(events)):
+            ev2 = events[j]
             if ev2.status != "active":
                 continue
             # Must be within 2 hours
@@ -149,16 +153,12 @@ def deduplicate_events():
                 continue
 
             # Check venue match
-            venue_score = fuzz.ratio(
-                ev1.venue_name.lower(), ev2.venue_name.lower()
-            )
+            venue_score = fuzz.ratio(venues[i], venues[j])
             if venue_score < 85:
                 continue
 
             # Check title match
-            t1 = normalize_title(ev1.title)
-            t2 = normalize_title(ev2.title)
-            title_score = fuzz.ratio(t1, t2)
+            title_score = fuzz.ratio(titles[i], titles[j])
             if title_score < 80:
                 continue
 
@@ -182,20 +182,36 @@ def deduplicate_events():
 
 
 def enrich_events(venues_config: dict):
-    """Enrich events with venue metadata from venues.yaml."""
+    """Enrich events with venue metadata from venues.yaml.
+
+    An event takes the first venues.yaml entry (in file order) whose name
+    fuzzy-matches (>85) its venue name. Many events share a venue, so each
+    distinct name is matched once per run.
+    """
+    names = list(venues_config)
+    lowered = [name.lower() for name in names]
+    matches = {}
     events = Event.select().where(Event.status == "active")
     enriched = 0
     for ev in events:
-        for venue_name, info in venues_config.items():
-            if fuzz.ratio(ev.venue_name.lower(), venue_name.lower()) > 85:
-                ev.neighborhood = info.get("neighborhood", "")
-                if info.get("lat"):
-                    ev.lat = info["lat"]
-                if info.get("lon"):
-                    ev.lon = info["lon"]
-                ev.save()
-                enriched += 1
-                break
+        if ev.venue_name not in matches:
+            matches[ev.venue_name] = next(
+                (names[idx] for _, score, idx in process.extract_iter(
+                    ev.venue_name.lower(), lowered, scorer=fuzz.ratio, score_cutoff=85)
+                 if score > 85),
+                None,
+            )
+        venue_name = matches[ev.venue_name]
+        if venue_name is None:
+            continue
+        info = venues_config[venue_name]
+        ev.neighborhood = info.get("neighborhood", "")
+        if info.get("lat"):
+            ev.lat = info["lat"]
+        if info.get("lon"):
+            ev.lon = info["lon"]
+        ev.save()
+        enriched += 1
     logger.info(f"Enriched {enriched} events with venue metadata")
     return enriched
 
@@ -237,7 +253,14 @@ def prune_low_scoring(source_name: str = None, min_score: float = 25.0) -> int:
 
 
 def run_ingestion(source_filter: str = None, backfill: bool = False):
-    """Main ingestion entry point."""
+    """Main ingestion entry point.
+
+    Sources run one after another, each as fetch + parse + store inside the
+    retry loop. Parsing stays in-process: it is small next to network time,
+    some parse() methods fetch sub-pages themselves (Jazz Gallery ICS,
+    generic follow_links), and ScrapeAdapter.run refetches based on what
+    parse() found, so it can't be split off into a process pool cleanly.
+    """
     init_db()
     sources_config = load_sources_config()
     venues_config = load_venues_config()
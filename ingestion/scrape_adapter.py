@@ -1,8 +1,30 @@
 """Generic BeautifulSoup scraper base."""
-import requests
-from bs4 import BeautifulSoup
+from __future__ import annotations
 
-from ingestion.base import BaseAdapter
+import re
+from typing import NamedTuple
+
+from bs4 import BeautifulSoup, Tag
+
+from ingestion import fetcher
+from ingestion.base import BaseAdapter, EventDict
+
+# Dollar amounts in scraped text, e.g. "$25" or "$19.50"
+PRICE_RE = re.compile(r"\$(\d+(?:\.\d{2})?)")
+
+
+class FieldRule(NamedTuple):
+    """What a field's element looks like, as a CSS selector list would say it.
+
+    An element matches if its tag is in `tags`, it has a class in `classes`
+    (like `.title`), or one of its classes contains a string in
+    `class_substrings` (like `[class*='title']`). If `attr` is set the element
+    must also carry that attribute (like `a[href]`).
+    """
+    tags: frozenset = frozenset()
+    classes: frozenset = frozenset()
+    class_substrings: tuple = ()
+    attr: str | None = None
 
 
 class ScrapeAdapter(BaseAdapter):
@@ -17,9 +39,69 @@ class ScrapeAdapter(BaseAdapter):
     }
 
     def fetch_html(self, url: str = None) -> str:
-        resp = requests.get(url or self.url, headers=self.HEADERS, timeout=30)
-        resp.raise_for_status()
-        return resp.text
+        return fetcher.fetch_html(url or self.url, headers=self.HEADERS)
+
+    def run(self) -> tuple[list[EventDict], str]:
+        """Fetch + parse, retrying once in a headless browser if a static
+        page turned out to be an empty JS shell (see ingestion.fetcher).
+
+        The host stays marked only if the browser retry returns events: a
+        rendered page with no events means the listing was simply empty, and
+        a retry that raises shouldn't leave the host on the browser path.
+        """
+        events, raw = super().run()
+        if not events and fetcher.mark_needs_js(self.url, raw):
+            self.logger.info(f"{self.name}: no events in static HTML, retrying with browser")
+            events = None
+            try:
+                events, raw = super().run()
+            finally:
+                if not events:
+                    fetcher.unmark_needs_js(self.url)
+        return events, raw
 
     def soup(self, html: str) -> BeautifulSoup:
         return BeautifulSoup(html, "html.parser")
+
+    @staticmethod
+    def scan_fields(block: Tag, rules: dict[str, FieldRule]) -> dict[str, Tag]:
+        """Find the first descendant matching each rule in one walk of `block`.
+
+        Equivalent to calling `block.select_one(selector)` once per field, since
+        select_one also returns the first match in document order, but the
+        block's subtree is only traversed once. Fields with no match are absent.
+        """
+        found = {}
+        pending = dict(rules)
+        for el in block.descendants:
+            if not isinstance(el, Tag):
+                continue
+            tag = el.name
+            classes = el.get("class") or ()
+            for field, rule in list(pending.items()):
+                if rule.attr and not el.has_attr(rule.attr):
+                    continue
+                if (tag in rule.tags
+                        or any(c in rule.classes for c in classes)
+                        or any(s in c for s in rule.class_substrings for c in classes)):
+                    found[field] = el
+                    del pending[field]
+            if not pending:
+                break
+        return found
+
+    @staticmethod
+    def select_first_tier(soup: BeautifulSoup, tiers: tuple[str, ...]) -> list[Tag]:
+        """Return the matches of the first selector in `tiers` that matches anything.
+
+        Same result as `soup.select(a) or soup.select(b) or ...`, but the page
+        is walked once with the union of all tiers and each hit is then sorted
+        into the tiers it matches.
+        """
+        hits = soup.select(", ".join(tiers))
+        for tier in tiers:
+            sieve = soup.css.compile(tier)
+            matched = [el for el in hits if sieve.match(el)]
+            if matched:
+                return matched
+        return []
@@ -12,7 +12,7 @@ import logging
 import requests
 from bs4 import BeautifulSoup
 
-from ingestion.base import BaseAdapter, EventDict
+from ingestion.base import BaseAdapter, EventDict, artist_entity
 
 logger = logging.getLogger(__name__)
 
@@ -75,11 +75,11 @@ class Adapter(BaseAdapter):
             entities = []
             for artist in item.get("artists", []):
                 if artist:
-                    entities.append({"type": "artist", "value": artist})
+                    entities.append(artist_entity(artist))
 
             # If no artists parsed from the list, try splitting the event name
             if not entities and name:
-                entities.append({"type": "artist", "value": name})
+                entities.append(artist_entity(name))
 
             # Price
             price = item.get("representative_ticket_price")
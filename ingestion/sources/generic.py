@@ -6,17 +6,27 @@ Avoids needing custom Python code per discovered source.
 """
 from __future__ import annotations
 
-import json
 import logging
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
+import orjson
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
-from ingestion.base import BaseAdapter, EventDict
+from ingestion.base import (
+    JSON_LD_EVENT_TYPES, BaseAdapter, EventDict, artist_entity, json_ld_blocks,
+)
+
+# Title suffixes stripped when a title stands in for the artist name
+STATUS_SUFFIX_RE = re.compile(r'\s*\((?:Sold Out|Low Tickets|Limited)\)\s*$', re.IGNORECASE)
+TOUR_SUFFIX_RE = re.compile(r'\s*[:–—]\s+.*(?:Tour|Live|Presents|Concert)\b', re.IGNORECASE)
 
 
 class Adapter(BaseAdapter):
@@ -30,6 +40,20 @@ class Adapter(BaseAdapter):
         )
     }
 
+    # extraction.strategy -> parse method
+    STRATEGIES = {
+        "json_ld": "_parse_json_ld",
+        "ics": "_parse_ics",
+        "css_selectors": "_parse_css",
+        "follow_links": "_parse_follow_links",
+    }
+
+    # Category for a JSON-LD event, by @type, when the source sets none
+    CATEGORY_BY_TYPE = {
+        "MusicEvent": "concert", "TheaterEvent": "theatre",
+        "ExhibitionEvent": "exhibition", "DanceEvent": "concert",
+    }
+
     def __init__(self, source_config: dict):
         super().__init__(source_config)
         self.extraction = source_config.get("extraction", {})
@@ -38,6 +62,18 @@ class Adapter(BaseAdapter):
         self.default_venue = self.extraction.get("default_venue", "")
         self.use_playwright = source_config.get("method") == "playwright"
 
+        # follow_links: event URL pattern, compiled once per source. Built
+        # from the listing URL if not configured, e.g. /shows matches
+        # /shows/some-event-slug. Other strategies never use it, so a stray
+        # link_pattern in their config can't fail construction.
+        self.link_re = None
+        if self.strategy == "follow_links":
+            link_pattern = self.extraction.get("link_pattern", "")
+            if not link_pattern:
+                base_path = urlparse(self.url).path.rstrip("/")
+                link_pattern = re.escape(base_path) + r"/[^/?#]+"
+            self.link_re = re.compile(link_pattern)
+
     def fetch_raw(self) -> str:
         if self.use_playwright:
             from ingestion.playwright_adapter import fetch_with_playwright
@@ -47,27 +83,20 @@ class Adapter(BaseAdapter):
         return resp.text
 
     def parse(self, raw: str) -> list[EventDict]:
-        if self.strategy == "json_ld":
-            return self._parse_json_ld(raw)
-        elif self.strategy == "ics":
-            return self._parse_ics(raw)
-        elif self.strategy == "css_selectors":
-            return self._parse_css(raw)
-        elif self.strategy == "follow_links":
-            return self._parse_follow_links(raw)
-        else:
+        method = self.STRATEGIES.get(self.strategy)
+        if method is None:
             self.logger.warning(f"Unknown strategy '{self.strategy}', trying json_ld")
-            return self._parse_json_ld(raw)
+            method = "_parse_json_ld"
+        return getattr(self, method)(raw)
 
     def _parse_json_ld(self, html: str) -> list[EventDict]:
         """Extract events from Schema.org JSON-LD markup."""
-        soup = BeautifulSoup(html, "html.parser")
         events = []
 
-        for script_tag in soup.find_all("script", type="application/ld+json"):
+        for block in json_ld_blocks(html):
             try:
-                data = json.loads(script_tag.string)
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(block)
+            except orjson.JSONDecodeError:
                 continue
 
             items = data if isinstance(data, list) else [data]
@@ -89,10 +118,8 @@ class Adapter(BaseAdapter):
 
     def _parse_jsonld_item(self, item: dict) -> EventDict | None:
         """Parse a single JSON-LD item into an EventDict."""
-        event_types = {"Event", "MusicEvent", "TheaterEvent",
-                       "DanceEvent", "ExhibitionEvent", "SocialEvent"}
         item_type = item.get("@type", "")
-        if item_type not in event_types:
+        if item_type not in JSON_LD_EVENT_TYPES:
             return None
 
         title = item.get("name", "").strip()
@@ -115,6 +142,9 @@ class Adapter(BaseAdapter):
         else:
             venue_name = self.default_venue or str(location)
             address = ""
+        # A page repeats its venue on every event; share one string
+        if type(venue_name) is str:
+            venue_name = sys.intern(venue_name)
 
         # Performers / entities
         entities = []
@@ -125,18 +155,18 @@ class Adapter(BaseAdapter):
             if isinstance(perf, dict):
                 name = perf.get("name", "")
                 if name:
-                    entities.append({"type": "artist", "value": name})
+                    entities.append(artist_entity(name))
             elif isinstance(perf, str) and perf:
-                entities.append({"type": "artist", "value": perf})
+                entities.append(artist_entity(perf))
 
         # If no performers listed, use event title as artist (common for venue listings)
         if not entities and title:
             # Strip status suffixes like "(Sold Out)", "(Low Tickets)"
-            artist_name = re.sub(r'\s*\((?:Sold Out|Low Tickets|Limited)\)\s*$', '', title, flags=re.IGNORECASE).strip()
+            artist_name = STATUS_SUFFIX_RE.sub("", title).strip()
             # Strip tour name suffixes like "Artist: Tour Name" or "Artist - Tour 2026"
-            artist_name = re.split(r'\s*[:–—]\s+.*(?:Tour|Live|Presents|Concert)\b', artist_name, flags=re.IGNORECASE)[0].strip()
+            artist_name = TOUR_SUFFIX_RE.split(artist_name)[0].strip()
             if artist_name:
-                entities.append({"type": "artist", "value": artist_name})
+                entities.append(artist_entity(artist_name))
 
         # Price
         offers = item.get("offers", {})
@@ -150,11 +180,7 @@ class Adapter(BaseAdapter):
         # Category from config or infer from @type
         category = self.default_category
         if not category:
-            type_to_cat = {
-                "MusicEvent": "concert", "TheaterEvent": "theatre",
-                "ExhibitionEvent": "exhibition", "DanceEvent": "concert",
-            }
-            category = type_to_cat.get(item_type, "")
+            category = self.CATEGORY_BY_TYPE.get(item_type, "")
 
         event_id = self.make_event_id(
             self.name,
@@ -272,22 +298,18 @@ class Adapter(BaseAdapter):
           link_pattern: regex to match event URLs (default: derived from URL path)
           max_pages: max sub-pages to fetch (default: 50)
           sub_strategy: how to extract from each sub-page (default: json_ld)
-          fetch_delay: seconds between requests (default: 1)
+          fetch_delay: seconds between request starts (default: 1)
+          max_workers: sub-pages fetched concurrently (default: 4)
         """
         soup = BeautifulSoup(html, "html.parser")
-        link_pattern = self.extraction.get("link_pattern", "")
         max_pages = int(self.extraction.get("max_pages", 50))
         sub_strategy = self.extraction.get("sub_strategy", "json_ld")
         fetch_delay = float(self.extraction.get("fetch_delay", 1))
-
-        # Build link pattern from URL if not configured
-        if not link_pattern:
-            parsed = urlparse(self.url)
-            # e.g. /shows → matches /shows/some-event-slug
-            base_path = parsed.path.rstrip("/")
-            link_pattern = re.escape(base_path) + r"/[^/?#]+"
+        max_workers = int(self.extraction.get("max_workers", 4))
 
         # Collect unique event URLs from the listing page
+        match_link = self.link_re.match
+        listing_url = self.url.rstrip("/")
         event_urls = []
         seen = set()
         for a in soup.find_all("a", href=True):
@@ -295,43 +317,59 @@ class Adapter(BaseAdapter):
             full_url = urljoin(self.url, href)
             # Strip query params and fragments for dedup
             clean = full_url.split("?")[0].split("#")[0]
-            if clean in seen or clean == self.url.rstrip("/"):
+            if clean in seen or clean == listing_url:
                 continue
             parsed_href = urlparse(full_url)
             path = parsed_href.path
-            if re.match(link_pattern, path):
+            if match_link(path):
                 seen.add(clean)
                 event_urls.append(clean)
 
         self.logger.info(f"follow_links: found {len(event_urls)} event page links")
         event_urls = event_urls[:max_pages]
 
-        # Fetch each sub-page and extract events
-        all_events = []
-        for i, event_url in enumerate(event_urls):
-            if i > 0:
-                time.sleep(fetch_delay)
+        parse_sub_page = self._parse_ics if sub_strategy == "ics" else self._parse_json_ld
+
+        # Fetch sub-pages on a few threads so responses overlap, while request
+        # starts stay at least fetch_delay apart (results keep link order)
+        lock = threading.Lock()
+        next_start = time.monotonic()
+
+        def fetch_events(event_url: str) -> list[EventDict]:
+            nonlocal next_start
+            with lock:
+                now = time.monotonic()
+                wait = next_start - now
+                next_start = max(now, next_start) + fetch_delay
+            if wait > 0:
+                time.sleep(wait)
             try:
-                resp = requests.get(event_url, headers=self.HEADERS, timeout=30)
+                resp = session.get(event_url, timeout=30)
                 resp.raise_for_status()
-                sub_html = resp.text
-
-                if sub_strategy == "json_ld":
-                    events = self._parse_json_ld(sub_html)
-                elif sub_strategy == "ics":
-                    events = self._parse_ics(sub_html)
-                else:
-                    events = self._parse_json_ld(sub_html)
+                events = parse_sub_page(resp.text)
 
                 # Set ticket_url to the sub-page URL if not already set
                 for ev in events:
                     if not ev.get("ticket_url"):
                         ev["ticket_url"] = event_url
-
-                all_events.extend(events)
+                return events
             except Exception as e:
                 self.logger.warning(f"follow_links: failed to fetch {event_url}: {e}")
-                continue
+                return []
+
+        all_events = []
+        if event_urls:
+            workers = min(max_workers, len(event_urls))
+            # One session per parse, pooled so every worker can keep its
+            # connection to the host alive between sub-pages
+            with requests.Session() as session:
+                session.headers.update(self.HEADERS)
+                adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for events in pool.map(fetch_events, event_urls):
+                        all_events.extend(events)
 
         self.logger.info(f"follow_links: extracted {len(all_events)} events from {len(event_urls)} pages")
         return all_events
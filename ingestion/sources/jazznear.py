@@ -1,11 +1,10 @@
 """JazzNearYou adapter — JSON-LD MusicEvent extraction."""
-import json
 from datetime import datetime
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
 
-from ingestion.base import BaseAdapter, EventDict
+from ingestion.base import BaseAdapter, EventDict, json_ld_blocks, artist_entity
 
 
 class Adapter(BaseAdapter):
@@ -31,13 +30,12 @@ class Adapter(BaseAdapter):
         return resp.text
 
     def parse(self, raw: str) -> list[EventDict]:
-        soup = BeautifulSoup(raw, "html.parser")
         events = []
 
-        for script_tag in soup.find_all("script", type="application/ld+json"):
+        for block in json_ld_blocks(raw):
             try:
-                data = json.loads(script_tag.string)
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(block)
+            except orjson.JSONDecodeError:
                 continue
 
             # Handle both single objects and arrays
@@ -72,9 +70,9 @@ class Adapter(BaseAdapter):
                     performers = [performers]
                 for perf in performers:
                     if isinstance(perf, dict):
-                        entities.append({"type": "artist", "value": perf.get("name", "")})
+                        entities.append(artist_entity(perf.get("name", "")))
                     elif isinstance(perf, str):
-                        entities.append({"type": "artist", "value": perf})
+                        entities.append(artist_entity(perf))
 
                 # Offers / price
                 offers = item.get("offers", {})
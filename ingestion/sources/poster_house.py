@@ -2,7 +2,7 @@
 import re
 from datetime import datetime
 
-from ingestion.scrape_adapter import ScrapeAdapter
+from ingestion.scrape_adapter import FieldRule, ScrapeAdapter
 from ingestion.base import EventDict
 
 
@@ -11,6 +11,32 @@ class Adapter(ScrapeAdapter):
 
     VENUE_NAME = "Poster House"
 
+    # Event block selectors, most specific first (see select_first_tier)
+    BLOCK_SELECTORS = (
+        ".event-card, .event-item, .event-listing",
+        "article, .card, .post-item",
+        "[class*='event']",
+    )
+
+    # Per-block fields, matched in a single pass (see ScrapeAdapter.scan_fields)
+    FIELD_RULES = {
+        # h2, h3, h4, .title, [class*='title']
+        "title": FieldRule(tags=frozenset({"h2", "h3", "h4"}),
+                           class_substrings=("title",)),
+        # .date, time, [class*='date'], [class*='time']
+        "date": FieldRule(tags=frozenset({"time"}),
+                          class_substrings=("date", "time")),
+        # .event-type, .category, .tag, [class*='type'], [class*='category']
+        "type": FieldRule(classes=frozenset({"tag"}),
+                          class_substrings=("type", "category")),
+        # p, .excerpt, .description, [class*='desc']
+        "description": FieldRule(tags=frozenset({"p"}),
+                                 classes=frozenset({"excerpt"}),
+                                 class_substrings=("desc",)),
+        # a[href]
+        "link": FieldRule(tags=frozenset({"a"}), attr="href"),
+    }
+
     def fetch_raw(self) -> str:
         return self.fetch_html()
 
@@ -19,11 +45,7 @@ class Adapter(ScrapeAdapter):
         events = []
 
         # Look for event listings on the /events page
-        event_blocks = (
-            soup.select(".event-card, .event-item, .event-listing")
-            or soup.select("article, .card, .post-item")
-            or soup.select("[class*='event']")
-        )
+        event_blocks = self.select_first_tier(soup, self.BLOCK_SELECTORS)
 
         for block in event_blocks:
             title = ""
@@ -32,32 +54,30 @@ class Adapter(ScrapeAdapter):
             ticket_url = ""
             description = ""
 
+            fields = self.scan_fields(block, self.FIELD_RULES)
+
             # Title
-            title_el = block.select_one("h2, h3, h4, .title, [class*='title']")
+            title_el = fields.get("title")
             if title_el:
                 title = title_el.get_text(strip=True)
 
             # Date
-            date_el = block.select_one(
-                ".date, time, [class*='date'], [class*='time']"
-            )
+            date_el = fields.get("date")
             if date_el:
                 date_str = date_el.get("datetime", "") or date_el.get_text(strip=True)
 
             # Event type / category tag
-            type_el = block.select_one(
-                ".event-type, .category, .tag, [class*='type'], [class*='category']"
-            )
+            type_el = fields.get("type")
             if type_el:
                 event_type = type_el.get_text(strip=True)
 
             # Description
-            desc_el = block.select_one("p, .excerpt, .description, [class*='desc']")
+            desc_el = fields.get("description")
             if desc_el:
                 description = desc_el.get_text(strip=True)
 
             # Link
-            link = block.select_one("a[href]")
+            link = fields.get("link")
             if link:
                 href = link.get("href", "")
                 if href.startswith("/"):
@@ -84,12 +104,8 @@ class Adapter(ScrapeAdapter):
                 # Use today as placeholder
                 start_dt = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
 
-            # Determine category
-            type_lower = (event_type + " " + title).lower()
-            if any(w in type_lower for w in ("exhibit", "display", "gallery", "poster")):
-                category = "exhibition"
-            else:
-                category = "exhibition"  # Default for Poster House
+            # Everything Poster House lists is filed as an exhibition
+            category = "exhibition"
 
             event_id = self.make_event_id("poster_house", f"{title[:40]}:{start_dt.date()}")
 
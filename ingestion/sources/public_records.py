@@ -3,7 +3,7 @@ import re
 from datetime import datetime
 
 from ingestion.scrape_adapter import ScrapeAdapter
-from ingestion.base import EventDict
+from ingestion.base import EventDict, artist_entity
 
 
 class Adapter(ScrapeAdapter):
@@ -80,7 +80,7 @@ class Adapter(ScrapeAdapter):
 
             # Use title as artist entity (strip "w/" prefixed guest format)
             artists = [a.strip() for a in re.split(r"[,&+]|w/", title) if a.strip()]
-            entities = [{"type": "artist", "value": a} for a in artists]
+            entities = [artist_entity(a) for a in artists]
 
             description = f"{room}" if room else ""
 
@@ -2,19 +2,43 @@
 import re
 from datetime import datetime
 
-from ingestion.scrape_adapter import ScrapeAdapter
-from ingestion.base import EventDict
+from ingestion.scrape_adapter import FieldRule, PRICE_RE, ScrapeAdapter
+from ingestion.base import EventDict, artist_entity
 
 
 class Adapter(ScrapeAdapter):
     """Scrape smallslive.com/tickets/ for upcoming events.
 
     Note: This site is JavaScript-heavy. If requests+BS4 returns no events,
-    a Playwright-based fallback would be needed.
+    ScrapeAdapter.run retries in a headless browser and remembers the host
+    (see ingestion.fetcher).
     """
 
     VENUE_NAME = "Smalls Jazz Club"
 
+    # Event block selectors, most specific first (see select_first_tier)
+    BLOCK_SELECTORS = (
+        ".event-card, .ticket-event, .event-item, .show-card",
+        "[class*='event'], [class*='show'], [class*='ticket']",
+        "article, .card",
+    )
+
+    # Per-block fields, matched in a single pass (see ScrapeAdapter.scan_fields)
+    FIELD_RULES = {
+        # h2, h3, h4, .event-title, .show-title, .artist-name,
+        # [class*='title'], [class*='artist']
+        "title": FieldRule(tags=frozenset({"h2", "h3", "h4"}),
+                           class_substrings=("title", "artist")),
+        # .date, .event-date, time, [class*='date']
+        "date": FieldRule(tags=frozenset({"time"}), class_substrings=("date",)),
+        # [class*='time']
+        "time": FieldRule(class_substrings=("time",)),
+        # [class*='price'], .price
+        "price": FieldRule(class_substrings=("price",)),
+        # a[href]
+        "link": FieldRule(tags=frozenset({"a"}), attr="href"),
+    }
+
     def fetch_raw(self) -> str:
         return self.fetch_html()
 
@@ -24,11 +48,7 @@ class Adapter(ScrapeAdapter):
 
         # Try to find event cards/listings
         # SmallsLive uses various class names for event listings
-        event_blocks = (
-            soup.select(".event-card, .ticket-event, .event-item, .show-card")
-            or soup.select("[class*='event'], [class*='show'], [class*='ticket']")
-            or soup.select("article, .card")
-        )
+        event_blocks = self.select_first_tier(soup, self.BLOCK_SELECTORS)
 
         for block in event_blocks:
             title = ""
@@ -37,33 +57,30 @@ class Adapter(ScrapeAdapter):
             ticket_url = ""
             price_text = ""
 
+            fields = self.scan_fields(block, self.FIELD_RULES)
+
             # Title / artist
-            title_el = block.select_one(
-                "h2, h3, h4, .event-title, .show-title, .artist-name, "
-                "[class*='title'], [class*='artist']"
-            )
+            title_el = fields.get("title")
             if title_el:
                 title = title_el.get_text(strip=True)
 
             # Date
-            date_el = block.select_one(
-                ".date, .event-date, time, [class*='date']"
-            )
+            date_el = fields.get("date")
             if date_el:
                 date_str = date_el.get("datetime", "") or date_el.get_text(strip=True)
 
             # Time
-            time_el = block.select_one("[class*='time']")
+            time_el = fields.get("time")
             if time_el:
                 time_str = time_el.get_text(strip=True)
 
             # Price
-            price_el = block.select_one("[class*='price'], .price")
+            price_el = fields.get("price")
             if price_el:
                 price_text = price_el.get_text(strip=True)
 
             # Ticket link
-            link = block.select_one("a[href]")
+            link = fields.get("link")
             if link:
                 href = link.get("href", "")
                 if href.startswith("/"):
@@ -90,11 +107,10 @@ class Adapter(ScrapeAdapter):
             if not start_dt:
                 continue
 
-            # Parse price
-            price_min = None
-            price_match = re.search(r'\$(\d+(?:\.\d{2})?)', price_text)
-            if price_match:
-                price_min = float(price_match.group(1))
+            # Parse price: first dollar amount, plus the highest one
+            prices = [float(m.group(1)) for m in PRICE_RE.finditer(price_text)]
+            price_min = prices[0] if prices else None
+            price_max = max(prices) if prices else None
 
             event_id = self.make_event_id("smalls", f"{title[:40]}:{start_dt.date()}")
 
@@ -105,9 +121,10 @@ class Adapter(ScrapeAdapter):
                 venue_name=self.VENUE_NAME,
                 address="183 W 10th St, New York, NY 10014",
                 price_min=price_min,
+                price_max=price_max,
                 ticket_url=ticket_url or "https://www.smallslive.com/tickets/",
                 category="jazz",
-                entities=[{"type": "artist", "value": title}],
+                entities=[artist_entity(title)],
             ))
 
         if not events:
@@ -1,12 +1,16 @@
 """Smoke Jazz Club adapter — HTML scrape from tickets.smokejazz.com."""
 from __future__ import annotations
 
-import re
 from datetime import datetime
 from urllib.parse import urljoin
 
-from ingestion.base import EventDict
-from ingestion.scrape_adapter import ScrapeAdapter
+from ingestion.base import EventDict, artist_entity
+from ingestion.scrape_adapter import PRICE_RE, ScrapeAdapter
+
+MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
 
 
 class Adapter(ScrapeAdapter):
@@ -41,21 +45,15 @@ class Adapter(ScrapeAdapter):
             if not date_str:
                 continue
 
-            start_dt = self.parse_datetime(f"{date_str}, {current_year}", "%a, %b %d, %Y")
+            start_dt = self._parse_card_date(date_str, current_year)
             if not start_dt:
                 continue
 
-            # Default show time: 7pm (Smoke's typical first set)
-            start_dt = start_dt.replace(hour=19)
-
-            # Price from text (first dollar amount)
+            # Price: first dollar amount in the text, plus the highest one
             text = perf.get_text(" ", strip=True)
-            price_match = re.search(r"\$(\d+(?:\.\d{2})?)", text)
-            price_min = float(price_match.group(1)) if price_match else None
-
-            # Find highest price too
-            all_prices = re.findall(r"\$(\d+(?:\.\d{2})?)", text)
-            price_max = max(float(p) for p in all_prices) if all_prices else None
+            prices = [float(m.group(1)) for m in PRICE_RE.finditer(text)]
+            price_min = prices[0] if prices else None
+            price_max = max(prices) if prices else None
 
             # Ticket link
             ticket_url = ""
@@ -64,11 +62,9 @@ class Adapter(ScrapeAdapter):
                 break
 
             # Extract artist entities from title
-            entities = [{"type": "artist", "value": title}]
+            entities = [artist_entity(title)]
 
-            event_id = self.make_event_id(
-                "smoke", f"{title}:{start_dt.strftime('%Y-%m-%d')}"
-            )
+            event_id = self.make_event_id("smoke", f"{title}:{start_dt.date()}")
 
             events.append(EventDict(
                 source_event_id=event_id,
@@ -85,3 +81,19 @@ class Adapter(ScrapeAdapter):
 
         self.logger.info(f"Smoke: parsed {len(events)} shows")
         return events
+
+    def _parse_card_date(self, date_str: str, year: int) -> datetime | None:
+        """Parse a card date like "Sun, Feb 15" into that day at 7pm.
+
+        Splits the common shape directly and only falls back to strptime
+        for anything unexpected.
+        """
+        try:
+            _, month, day = date_str.replace(",", " ").split()
+            start_dt = datetime(year, MONTHS[month.title()], int(day))
+        except (KeyError, ValueError):
+            start_dt = self.parse_datetime(f"{date_str}, {year}", "%a, %b %d, %Y")
+            if not start_dt:
+                return None
+        # Default show time: 7pm (Smoke's typical first set)
+        return start_dt.replace(hour=19)
@@ -3,7 +3,11 @@ import os
 from datetime import datetime, timedelta
 
 from ingestion.json_api_adapter import JSONAPIAdapter
-from ingestion.base import EventDict
+from ingestion.base import EventDict, artist_entity
+
+# Shared default for missing nested objects in parse(); never mutated.
+# Missing arrays default to () for the same reason.
+_EMPTY_DICT: dict = {}
 
 
 class Adapter(JSONAPIAdapter):
@@ -68,46 +72,45 @@ class Adapter(JSONAPIAdapter):
 
     def parse(self, raw: dict) -> list[EventDict]:
         events = []
-        embedded = raw.get("_embedded", {})
-        for item in embedded.get("events", []):
+        embedded = raw.get("_embedded") or _EMPTY_DICT
+        for item in embedded.get("events") or ():
             event_id = item.get("id", "")
             title = item.get("name", "")
-            start_info = item.get("dates", {}).get("start", {})
+            start_info = (item.get("dates") or _EMPTY_DICT).get("start") or _EMPTY_DICT
             start_str = start_info.get("dateTime") or start_info.get("localDate", "")
             start_dt = self.parse_datetime(start_str)
             if not start_dt:
                 continue
 
+            embedded_item = item.get("_embedded") or _EMPTY_DICT
+
             # Venue info
-            venues = item.get("_embedded", {}).get("venues", [])
-            venue = venues[0] if venues else {}
+            venues = embedded_item.get("venues") or ()
+            venue = venues[0] if venues else _EMPTY_DICT
             venue_name = venue.get("name", "Unknown Venue")
-            address_parts = []
-            if venue.get("address", {}).get("line1"):
-                address_parts.append(venue["address"]["line1"])
-            if venue.get("city", {}).get("name"):
-                address_parts.append(venue["city"]["name"])
-            address = ", ".join(address_parts)
+            line1 = (venue.get("address") or _EMPTY_DICT).get("line1")
+            city = (venue.get("city") or _EMPTY_DICT).get("name")
+            address = ", ".join(part for part in (line1, city) if part)
 
             # Price
-            price_ranges = item.get("priceRanges", [])
+            price_ranges = item.get("priceRanges") or ()
             price_min = price_ranges[0].get("min") if price_ranges else None
             price_max = price_ranges[0].get("max") if price_ranges else None
 
             # Category
-            classifications = item.get("classifications", [])
+            classifications = item.get("classifications") or ()
             genre = ""
             if classifications:
-                genre = classifications[0].get("genre", {}).get("name", "").lower()
+                genre = (classifications[0].get("genre") or _EMPTY_DICT).get("name", "").lower()
 
             category = "jazz" if "jazz" in genre else "concert"
 
             ticket_url = item.get("url", "")
 
             entities = []
-            attractions = item.get("_embedded", {}).get("attractions", [])
+            attractions = embedded_item.get("attractions") or ()
             for att in attractions:
-                entities.append({"type": "artist", "value": att.get("name", "")})
+                entities.append(artist_entity(att.get("name", "")))
 
             events.append(EventDict(
                 source_event_id=self.make_event_id("ticketmaster", event_id),
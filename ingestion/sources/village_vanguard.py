@@ -2,8 +2,8 @@
 import re
 from datetime import datetime, timedelta
 
-from ingestion.scrape_adapter import ScrapeAdapter
-from ingestion.base import EventDict
+from ingestion.scrape_adapter import FieldRule, ScrapeAdapter
+from ingestion.base import EventDict, artist_entity
 
 
 class Adapter(ScrapeAdapter):
@@ -11,6 +11,28 @@ class Adapter(ScrapeAdapter):
 
     VENUE_NAME = "Village Vanguard"
 
+    # Event block selectors, most specific first (see select_first_tier)
+    BLOCK_SELECTORS = (
+        ".event-listing, .schedule-item, .event, .entry",
+        "article",
+        ".content-wrapper h2, .content-wrapper h3",
+    )
+
+    # Per-block fields, matched in a single pass (see ScrapeAdapter.scan_fields)
+    FIELD_RULES = {
+        # h2, h3, h4, .title, .event-title, .artist
+        "title": FieldRule(tags=frozenset({"h2", "h3", "h4"}),
+                           classes=frozenset({"title", "event-title", "artist"})),
+        # .date, .event-date, time
+        "date": FieldRule(tags=frozenset({"time"}),
+                          classes=frozenset({"date", "event-date"})),
+        # .description, .event-description, p
+        "description": FieldRule(tags=frozenset({"p"}),
+                                 classes=frozenset({"description", "event-description"})),
+        # a[href]
+        "link": FieldRule(tags=frozenset({"a"}), attr="href"),
+    }
+
     def fetch_raw(self) -> str:
         return self.fetch_html()
 
@@ -23,11 +45,7 @@ class Adapter(ScrapeAdapter):
         # The site structure varies, so we try multiple selectors.
 
         # Try common patterns for event listings
-        event_blocks = (
-            soup.select(".event-listing, .schedule-item, .event, .entry")
-            or soup.select("article")
-            or soup.select(".content-wrapper h2, .content-wrapper h3")
-        )
+        event_blocks = self.select_first_tier(soup, self.BLOCK_SELECTORS)
 
         # If structured blocks aren't found, try to parse the main content
         if not event_blocks:
@@ -38,25 +56,26 @@ class Adapter(ScrapeAdapter):
             date_str = ""
             description = ""
 
+            fields = {}
             if hasattr(block, "select"):
+                fields = self.scan_fields(block, self.FIELD_RULES)
+
                 # Try to find title
-                title_el = (
-                    block.select_one("h2, h3, h4, .title, .event-title, .artist")
-                )
+                title_el = fields.get("title")
                 if title_el:
                     title = title_el.get_text(strip=True)
                 elif hasattr(block, "get_text"):
                     title = block.get_text(strip=True)
 
                 # Try to find date
-                date_el = block.select_one(".date, .event-date, time")
+                date_el = fields.get("date")
                 if date_el:
                     date_str = date_el.get_text(strip=True)
                     if date_el.get("datetime"):
                         date_str = date_el["datetime"]
 
                 # Description
-                desc_el = block.select_one(".description, .event-description, p")
+                desc_el = fields.get("description")
                 if desc_el:
                     description = desc_el.get_text(strip=True)
             else:
@@ -80,7 +99,7 @@ class Adapter(ScrapeAdapter):
                 pass
 
             ticket_url = ""
-            link = block.select_one("a[href]") if hasattr(block, "select_one") else None
+            link = fields.get("link")
             if link:
                 href = link.get("href", "")
                 if href.startswith("/"):
@@ -98,7 +117,7 @@ class Adapter(ScrapeAdapter):
                 address="178 7th Ave S, New York, NY 10014",
                 ticket_url=ticket_url or "https://villagevanguard.com",
                 category="jazz",
-                entities=[{"type": "artist", "value": title}],
+                entities=[artist_entity(title)],
             ))
 
         return events
@@ -4,60 +4,112 @@ from __future__ import annotations
 import os
 import json
 import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from rapidfuzz import fuzz
+from ranking.scorer import (
+    _load_taste_profile, event_artist_names, fuzzy_artist_key, fuzzy_venue_key,
+    known_artist_names, load_preferences, load_venues, lowered_artist_names,
+)
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache for explanations within a run
-_explanation_cache: dict[str, str] = {}
+# Events per bulk LLM request, and how many bulk requests may be in flight at once
+LLM_BATCH_SIZE = 10
+LLM_MAX_CONCURRENCY = 8
+LLM_TIMEOUT = 30  # seconds per request
+
+# LLM explanations are kept on disk so later runs only pay for new or changed
+# events. Entries older than EXPLANATION_MAX_AGE are dropped on load, and only
+# the newest EXPLANATION_CACHE_SIZE are kept.
+EXPLANATION_CACHE_PATH = os.environ.get("EXPLANATION_CACHE_PATH", "data/explanations.json")
+EXPLANATION_CACHE_SIZE = 2048
+EXPLANATION_MAX_AGE = 30 * 24 * 3600  # seconds
+
+# In-memory LRU of every explanation (LLM or template) served in this process
+_explanation_cache: OrderedDict[str, str] = OrderedDict()
+
+# cache key -> [explanation, created_at], as stored at EXPLANATION_CACHE_PATH
+_persisted_explanations: dict[str, list] | None = None
 
 
 def _get_venue_vibes(event, venues_config: dict) -> list[str]:
     """Get vibe tags for an event's venue."""
-    for name, info in venues_config.items():
-        if fuzz.ratio(event.venue_name.lower(), name.lower()) > 85:
-            return info.get("vibe_tags", [])
-    return []
+    name = fuzzy_venue_key((event.venue_name,), tuple(venues_config))
+    return venues_config[name].get("vibe_tags", []) if name is not None else []
+
+
+# Category → noun used in template explanations
+_CATEGORY_LABELS = {
+    "jazz": "jazz spot",
+    "exhibition": "exhibition space",
+    "concert": "music venue",
+}
 
+# Vibe tags that lead the description when present, in priority order
+_VIBE_PRIORITY = ("intimate", "elegant", "legendary")
 
-def explain_template(event, prefs: dict, venues_config: dict) -> str:
+# Shared wording for template explanations (see _render_template)
+_EXPLANATION_TEMPLATE = (
+    "{venue_name} is a {vibe_desc} {cat_label} in {neighborhood}. "
+    "{artist_str} at {time_str}{price_str}. "
+    "{travel_note}{social_note}"
+)
+
+
+def _vibes_by_venue(events, venues_config: dict,
+                    vibes_by_venue: dict[str, list[str]] | None = None) -> dict[str, list[str]]:
+    """Map each distinct venue name in `events` to its vibe tags.
+
+    Lookups already in `vibes_by_venue` are kept, so a map built once in
+    explain_events can be handed to both the LLM and the template paths.
+    """
+    vibes_by_venue = {} if vibes_by_venue is None else vibes_by_venue
+    for event in events:
+        if event.venue_name not in vibes_by_venue:
+            vibes_by_venue[event.venue_name] = _get_venue_vibes(event, venues_config)
+    return vibes_by_venue
+
+
+def explain_template(event, prefs: dict, venues_config: dict,
+                     vibes: list[str] | None = None) -> str:
     """Generate a template-based explanation (no LLM needed)."""
-    vibes = _get_venue_vibes(event, venues_config)
+    if vibes is None:
+        vibes = _get_venue_vibes(event, venues_config)
+    return _render_template(event, prefs, vibes)
+
+
+def explain_templates_bulk(events, prefs: dict, venues_config: dict,
+                           vibes_by_venue: dict[str, list[str]] | None = None) -> list[str]:
+    """Generate template explanations for a batch of events.
+
+    Venue vibes are fuzzy-matched once per distinct venue name rather than
+    once per event, so a venue with many shows in the batch costs one lookup.
+    """
+    vibes_by_venue = _vibes_by_venue(events, venues_config, vibes_by_venue)
+    return [_render_template(event, prefs, vibes_by_venue[event.venue_name])
+            for event in events]
+
+
+def _render_template(event, prefs: dict, vibes: list[str]) -> str:
+    """Fill _EXPLANATION_TEMPLATE for one event with its venue's vibe tags."""
     neighborhood = event.neighborhood or "NYC"
 
     # Build vibe description
-    vibe_desc = ""
-    if "intimate" in vibes:
-        vibe_desc = "intimate"
-    elif "elegant" in vibes:
-        vibe_desc = "elegant"
-    elif "legendary" in vibes:
-        vibe_desc = "legendary"
-    elif vibes:
-        vibe_desc = vibes[0]
-    else:
-        vibe_desc = "cool"
+    vibe_set = frozenset(vibes)
+    vibe_desc = next((v for v in _VIBE_PRIORITY if v in vibe_set),
+                     vibes[0] if vibes else "cool")
 
     # Category label
-    cat = event.category or "music"
-    if cat == "jazz":
-        cat_label = "jazz spot"
-    elif cat == "exhibition":
-        cat_label = "exhibition space"
-    elif cat == "concert":
-        cat_label = "music venue"
-    else:
-        cat_label = "venue"
+    cat_label = _CATEGORY_LABELS.get(event.category, "venue")
 
     # Time description
     start_dt = event.start_dt
     if hasattr(start_dt, "strftime"):
         time_str = start_dt.strftime("%-I:%M %p")
-        day_str = start_dt.strftime("%A")
     else:
         time_str = "tonight"
-        day_str = ""
 
     # Price info
     price_str = ""
@@ -75,46 +127,71 @@ def explain_template(event, prefs: dict, venues_config: dict) -> str:
 
     # Social note
     social_note = ""
-    if "date-friendly" in vibes:
+    if "date-friendly" in vibe_set:
         social_note = " Great date spot."
-    elif "listening-room" in vibes:
+    elif "listening-room" in vibe_set:
         social_note = " Serious listening room — come for the music."
 
     # Artist info from entities
-    artists = []
     try:
-        for ent in event.entities:
-            if ent.entity_type == "artist":
-                artists.append(ent.entity_value)
+        artists = event_artist_names(event)
     except Exception:
-        pass
+        artists = ()
 
     artist_str = artists[0] if artists else event.title
 
-    explanation = (
-        f"{event.venue_name} is a {vibe_desc} {cat_label} in {neighborhood}. "
-        f"{artist_str} at {time_str}{price_str}. "
-        f"{travel_note}{social_note}"
+    explanation = _EXPLANATION_TEMPLATE.format(
+        venue_name=event.venue_name,
+        vibe_desc=vibe_desc,
+        cat_label=cat_label,
+        neighborhood=neighborhood,
+        artist_str=artist_str,
+        time_str=time_str,
+        price_str=price_str,
+        travel_note=travel_note,
+        social_note=social_note,
     )
     return explanation.strip()
 
 
-def explain_llm(event, prefs: dict, venues_config: dict) -> str | None:
-    """Generate explanation via LLM API. Returns None if unavailable."""
+def _llm_provider() -> str | None:
+    """Return the configured LLM provider if its API key is set, else None."""
     provider = os.environ.get("LLM_PROVIDER", "").lower()
+    if provider == "anthropic" and os.environ.get("ANTHROPIC_API_KEY"):
+        return provider
+    if provider == "openai" and os.environ.get("OPENAI_API_KEY"):
+        return provider
+    return None
+
+
+_llm_clients: dict[str, object] = {}
+
+
+def _llm_client(provider: str):
+    """Return a client for `provider`, created once and reused so requests
+    share its connection pool."""
+    if provider not in _llm_clients:
+        if provider == "anthropic":
+            import anthropic
+            _llm_clients[provider] = anthropic.Anthropic(
+                api_key=os.environ["ANTHROPIC_API_KEY"], timeout=LLM_TIMEOUT)
+        else:
+            import openai
+            _llm_clients[provider] = openai.OpenAI(
+                api_key=os.environ["OPENAI_API_KEY"], timeout=LLM_TIMEOUT)
+    return _llm_clients[provider]
+
+
+def _llm_complete(prompt: str, max_tokens: int) -> str | None:
+    """Send a single-turn prompt to the configured LLM. Returns None if unavailable."""
+    provider = _llm_provider()
 
     if provider == "anthropic":
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            return None
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
-            vibes = _get_venue_vibes(event, venues_config)
-            prompt = _build_prompt(event, prefs, vibes)
+            client = _llm_client(provider)
             response = client.messages.create(
                 model="claude-sonnet-4-5-20250929",
-                max_tokens=150,
+                max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
             )
             return response.content[0].text.strip()
@@ -123,17 +200,11 @@ def explain_llm(event, prefs: dict, venues_config: dict) -> str | None:
             return None
 
     elif provider == "openai":
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            return None
         try:
-            import openai
-            client = openai.OpenAI(api_key=api_key)
-            vibes = _get_venue_vibes(event, venues_config)
-            prompt = _build_prompt(event, prefs, vibes)
+            client = _llm_client(provider)
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
-                max_tokens=150,
+                max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
             )
             return response.choices[0].message.content.strip()
@@ -144,59 +215,129 @@ def explain_llm(event, prefs: dict, venues_config: dict) -> str | None:
     return None
 
 
+def explain_llm(event, prefs: dict, venues_config: dict,
+                vibes: list[str] | None = None) -> str | None:
+    """Generate explanation via LLM API. Returns None if unavailable."""
+    if not _llm_provider():
+        return None
+    if vibes is None:
+        vibes = _get_venue_vibes(event, venues_config)
+    return _llm_complete(_build_prompt(event, prefs, vibes), max_tokens=150)
+
+
+def explain_llm_bulk(events, prefs: dict, venues_config: dict,
+                     vibes_by_venue: dict[str, list[str]] | None = None) -> list[str | None]:
+    """Generate explanations for several events with a single LLM request.
+
+    Returns one entry per event, in order. Entries are None when the LLM is
+    unavailable or its reply can't be parsed, so callers can fall back to
+    templates.
+    """
+    missing = [None] * len(events)
+    if not events or not _llm_provider():
+        return missing
+
+    vibes_by_venue = _vibes_by_venue(events, venues_config, vibes_by_venue)
+    prompt = _build_bulk_prompt(events, prefs, vibes_by_venue)
+    text = _llm_complete(prompt, max_tokens=150 * len(events))
+    if not text:
+        return missing
+
+    # Tolerate a fenced or prefixed reply by slicing out the JSON array
+    try:
+        explanations = json.loads(text[text.index("["):text.rindex("]") + 1])
+    except ValueError:
+        logger.warning("LLM bulk explanation reply was not a JSON array")
+        return missing
+    if not isinstance(explanations, list) or len(explanations) != len(events):
+        logger.warning(f"LLM bulk explanation did not return {len(events)} items")
+        return missing
+
+    return [str(e).strip() or None for e in explanations]
+
+
+def explain_llm_batched(events, prefs: dict, venues_config: dict,
+                        vibes_by_venue: dict[str, list[str]] | None = None) -> list[str | None]:
+    """explain_llm_bulk for any number of events.
+
+    Events are split into LLM_BATCH_SIZE chunks so each reply stays short
+    enough to come back whole, and the chunk requests run concurrently
+    (up to LLM_MAX_CONCURRENCY) instead of one after another.
+    """
+    chunks = [events[i:i + LLM_BATCH_SIZE] for i in range(0, len(events), LLM_BATCH_SIZE)]
+    vibes_by_venue = _vibes_by_venue(events, venues_config, vibes_by_venue)
+    if len(chunks) <= 1:
+        return explain_llm_bulk(events, prefs, venues_config, vibes_by_venue)
+
+    with ThreadPoolExecutor(max_workers=min(LLM_MAX_CONCURRENCY, len(chunks))) as pool:
+        results = pool.map(
+            lambda chunk: explain_llm_bulk(chunk, prefs, venues_config, vibes_by_venue), chunks)
+        return [text for chunk_result in results for text in chunk_result]
+
+
 def _build_prompt(event, prefs: dict, vibes: list[str]) -> str:
     return (
         f"You're a concise NYC nightlife concierge. Write 1-2 sentences explaining "
-        f"why someone who likes {', '.join(prefs.get('vibe_preferences', ['jazz']))} "
+        f"why someone who likes {', '.join(prefs.get('vibe_preferences') or ['jazz'])} "
         f"would enjoy this event:\n\n"
+        f"{_event_details(event, vibes)}\n\n"
+        f"Keep it suave, knowledgeable, not touristy. Max 2 sentences."
+    )
+
+
+def _build_bulk_prompt(events, prefs: dict, vibes_by_venue: dict[str, list[str]]) -> str:
+    details = "\n\n".join(
+        f"{i}.\n{_event_details(event, vibes_by_venue[event.venue_name])}"
+        for i, event in enumerate(events, 1)
+    )
+    return (
+        f"You're a concise NYC nightlife concierge. For each numbered event below, "
+        f"write 1-2 sentences explaining why someone who likes "
+        f"{', '.join(prefs.get('vibe_preferences') or ['jazz'])} would enjoy it.\n\n"
+        f"{details}\n\n"
+        f"Keep it suave, knowledgeable, not touristy. Max 2 sentences each. "
+        f"Reply with only a JSON array of {len(events)} strings, in event order."
+    )
+
+
+def _event_details(event, vibes: list[str]) -> str:
+    return (
         f"Event: {event.title}\n"
         f"Venue: {event.venue_name} ({', '.join(vibes)})\n"
         f"Neighborhood: {event.neighborhood}\n"
         f"Category: {event.category}\n"
         f"Time: {event.start_dt}\n"
-        f"Price: ${event.price_min or '?'}\n\n"
-        f"Keep it suave, knowledgeable, not touristy. Max 2 sentences."
+        f"Price: ${event.price_min or '?'}"
     )
 
 
-def match_reasons(event, scores: dict, prefs: dict = None, venues: dict = None) -> list[str]:
+def match_reasons(event, scores: dict) -> list[str]:
     """Return 1-2 short reason strings based on which scoring signals fired.
 
     Uses individual signal values from scores["signals"] to determine
     the most relevant reasons for recommending this event.
     """
-    import yaml
-
-    if prefs is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
-        with open(os.path.join(config_dir, "preferences.yaml")) as f:
-            prefs = yaml.safe_load(f)
-    if venues is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
-        with open(os.path.join(config_dir, "venues.yaml")) as f:
-            venues = yaml.safe_load(f).get("venues", {})
-
     signals = scores.get("signals", {})
     reasons = []
 
     # Concert history — strongest signal, show first
     concert_signal = signals.get("concert_history", 0)
     if concert_signal > 0:
-        # Look up seen count from taste_profile
-        config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
+        # Look up seen count from taste_profile (same cached load the scorer uses)
         try:
-            with open(os.path.join(config_dir, "taste_profile.yaml")) as f:
-                taste = yaml.safe_load(f) or {}
+            taste = _load_taste_profile()
             concert_artists = taste.get("concert_history", {}).get("artists", {})
             # Find best matching artist to get seen count
-            artist_names = [e.entity_value for e in event.entities if e.entity_type == "artist"]
+            artist_names = event_artist_names(event)
+            known_artists = known_artist_names(taste, "concert_history", concert_artists)
+            lowered = lowered_artist_names(taste, "concert_history", known_artists)
             seen_count = 1
             for artist in artist_names:
-                for known, stats in concert_artists.items():
-                    if fuzz.ratio(artist.lower(), known.lower()) > 85:
-                        count = stats.get("seen", 1) if isinstance(stats, dict) else 1
-                        seen_count = max(seen_count, count)
-                        break
+                known = fuzzy_artist_key(artist, known_artists, lowered)
+                if known is not None:
+                    stats = concert_artists[known]
+                    count = stats.get("seen", 1) if isinstance(stats, dict) else 1
+                    seen_count = max(seen_count, count)
             if seen_count >= 2:
                 reasons.append(f"Seen live {seen_count}x")
             else:
@@ -236,26 +377,105 @@ def match_reasons(event, scores: dict, prefs: dict = None, venues: dict = None)
 
 def explain_event(event, prefs: dict = None, venues_config: dict = None) -> str:
     """Generate explanation, trying LLM first then falling back to template."""
-    import yaml
+    return explain_events([event], prefs, venues_config)[0]
 
+
+def explain_events(events, prefs: dict = None, venues_config: dict = None) -> list[str]:
+    """Generate explanations for a batch of events, in order.
+
+    Cached events are reused, including LLM explanations saved by earlier
+    runs; the rest go to the LLM in concurrent bulk requests (or the
+    single-event path when only one is missing), and anything the LLM
+    doesn't cover falls back to templates.
+    """
     if prefs is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
-        with open(os.path.join(config_dir, "preferences.yaml")) as f:
-            prefs = yaml.safe_load(f)
+        prefs = load_preferences()
     if venues_config is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
-        with open(os.path.join(config_dir, "venues.yaml")) as f:
-            venues_config = yaml.safe_load(f).get("venues", {})
-
-    # Check cache
-    cache_key = f"{event.id}:{event.title}"
-    if cache_key in _explanation_cache:
-        return _explanation_cache[cache_key]
-
-    # Try LLM
-    explanation = explain_llm(event, prefs, venues_config)
-    if not explanation:
-        explanation = explain_template(event, prefs, venues_config)
-
-    _explanation_cache[cache_key] = explanation
-    return explanation
+        venues_config = load_venues()
+
+    persisted = _load_persisted_explanations()
+    found = {}
+    misses = []
+    for ev in events:
+        key = _cache_key(ev)
+        text = _explanation_cache.get(key)
+        if text is None and key in persisted:
+            text = persisted[key][0]
+        if text is None:
+            misses.append(ev)
+        else:
+            found[key] = text
+            _remember(key, text)
+
+    if misses:
+        # Venue vibes are looked up once here and shared by the LLM and template paths
+        vibes_by_venue = _vibes_by_venue(misses, venues_config)
+        if len(misses) == 1:
+            vibes = vibes_by_venue[misses[0].venue_name]
+            llm_explanations = [explain_llm(misses[0], prefs, venues_config, vibes)]
+        else:
+            llm_explanations = explain_llm_batched(misses, prefs, venues_config, vibes_by_venue)
+
+        fallback = [ev for ev, text in zip(misses, llm_explanations) if not text]
+        templates = iter(explain_templates_bulk(fallback, prefs, venues_config, vibes_by_venue))
+        now = time.time()
+        for ev, text in zip(misses, llm_explanations):
+            key = _cache_key(ev)
+            # Templates are cheap to rebuild and track config changes, so
+            # only LLM output is written to disk
+            if text:
+                persisted[key] = [text, now]
+            found[key] = text or next(templates)
+            _remember(key, found[key])
+        if any(llm_explanations):
+            _save_persisted_explanations()
+
+    return [found[_cache_key(ev)] for ev in events]
+
+
+def _cache_key(event) -> str:
+    # raw_hash changes whenever ingestion sees new event details
+    return f"{event.id}:{event.title}:{getattr(event, 'raw_hash', '')}"
+
+
+def _remember(key: str, text: str):
+    _explanation_cache[key] = text
+    _explanation_cache.move_to_end(key)
+    if len(_explanation_cache) > EXPLANATION_CACHE_SIZE:
+        _explanation_cache.popitem(last=False)
+
+
+def _load_persisted_explanations() -> dict[str, list]:
+    global _persisted_explanations
+    if _persisted_explanations is None:
+        try:
+            with open(EXPLANATION_CACHE_PATH) as f:
+                stored = json.load(f)
+        except (FileNotFoundError, ValueError):
+            stored = {}
+        if not isinstance(stored, dict):
+            stored = {}
+        cutoff = time.time() - EXPLANATION_MAX_AGE
+        # Entries are [text, saved_at]; anything else (hand edits, older
+        # formats) is skipped rather than failing explanation generation
+        _persisted_explanations = {
+            k: v for k, v in stored.items()
+            if isinstance(v, list) and len(v) == 2 and isinstance(v[0], str)
+            and isinstance(v[1], (int, float)) and v[1] >= cutoff
+        }
+    return _persisted_explanations
+
+
+def _save_persisted_explanations():
+    persisted = _load_persisted_explanations()
+    if len(persisted) > EXPLANATION_CACHE_SIZE:
+        newest = sorted(persisted.items(), key=lambda kv: kv[1][1])[-EXPLANATION_CACHE_SIZE:]
+        persisted.clear()
+        persisted.update(newest)
+    os.makedirs(os.path.dirname(EXPLANATION_CACHE_PATH) or ".", exist_ok=True)
+    # Write a temp file and swap it in, so an interrupted run can't leave a
+    # truncated cache behind
+    tmp = EXPLANATION_CACHE_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(persisted, f, ensure_ascii=False)
+    os.replace(tmp, EXPLANATION_CACHE_PATH)
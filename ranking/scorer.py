@@ -1,25 +1,111 @@
 """Event scoring based on user preferences."""
 from __future__ import annotations
 
+import functools
 import os
+import re
 from datetime import datetime
 
-import yaml
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+
+from config import derive_cached, load_yaml_cached
 
 CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "config")
 
 
 def load_preferences() -> dict:
-    path = os.path.join(CONFIG_DIR, "preferences.yaml")
-    with open(path) as f:
-        return yaml.safe_load(f)
+    return load_yaml_cached(os.path.join(CONFIG_DIR, "preferences.yaml"))
 
 
 def load_venues() -> dict:
-    path = os.path.join(CONFIG_DIR, "venues.yaml")
-    with open(path) as f:
-        return yaml.safe_load(f).get("venues", {})
+    return load_yaml_cached(os.path.join(CONFIG_DIR, "venues.yaml")).get("venues", {})
+
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_ROOM_SUFFIX_RE = re.compile(r"\s*\(.*\)\s*$")
+
+
+def _canonical_name(name: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(_PUNCT_RE.sub("", name.lower()).split())
+
+
+@functools.lru_cache(maxsize=64)
+def _canonical_index(names: tuple[str, ...]) -> dict[str, int]:
+    """Canonical name -> position of the first name with that canonical form."""
+    index = {}
+    for i, name in enumerate(names):
+        index.setdefault(_canonical_name(name), i)
+    return index
+
+
+@functools.lru_cache(maxsize=4096)
+def fuzzy_venue_key(queries: tuple[str, ...], names: tuple[str, ...]) -> str | None:
+    """Return the first of `names` that fuzzy-matches (>85) any of `queries`.
+
+    A name that only differs from a query by case, punctuation or spacing is
+    found with a dict lookup, but it only short-cuts the search: names before
+    it are still scanned (inside rapidfuzz), so an earlier fuzzy match wins
+    exactly as in a plain ordered scan.
+
+    Every scoring category looks up the same venue for the same event, and a
+    digest has many events per venue, so results are cached on the venue
+    name(s) and the tuple of config keys. Keying on the names rather than the
+    config dict means a reloaded venues.yaml with new entries misses the cache.
+    """
+    lowered_queries = [q.lower() for q in queries]
+    lowered = [name.lower() for name in names]
+    first = len(names)
+
+    index = _canonical_index(names)
+    for q in queries:
+        i = index.get(_canonical_name(q))
+        if (i is not None and i < first
+                and any(fuzz.ratio(lq, lowered[i]) > 85 for lq in lowered_queries)):
+            first = i
+
+    # Anything earlier that fuzzy-matches comes first
+    for lq in lowered_queries:
+        for _, score, idx in process.extract_iter(lq, lowered[:first],
+                                                  scorer=fuzz.ratio, score_cutoff=85):
+            if score > 85:
+                first = idx
+                break
+    return names[first] if first < len(names) else None
+
+
+def known_artist_names(profile: dict, section: str, artists: dict) -> tuple[str, ...]:
+    """Names in `artists`, one artist section of `profile`, as the tuple
+    fuzzy_artist_key takes.
+
+    For a profile parsed by load_yaml_cached the tuple is made once per parse
+    rather than once per event, and is dropped when the file changes.
+    """
+    return derive_cached(profile, f"artist_names:{section}", lambda: tuple(artists))
+
+
+def lowered_artist_names(profile: dict, section: str, names: tuple[str, ...]) -> list[str]:
+    """Lowercased copy of `names` (from known_artist_names), cached the same way."""
+    return derive_cached(profile, f"artist_names_lower:{section}",
+                         lambda: [name.lower() for name in names])
+
+
+def fuzzy_artist_key(artist: str, names: tuple[str, ...],
+                     lowered: list[str] | None = None) -> str | None:
+    """Return the first of `names` that fuzzy-matches (>85) `artist`.
+
+    The known-artist lists in taste_profile.yaml run to hundreds of names, so
+    the comparison loop runs inside rapidfuzz (process.extract_iter) against
+    `lowered`, the lowercased names as lowered_artist_names caches them per
+    parse. Without it the names are lowered on every call.
+    """
+    if lowered is None:
+        lowered = [name.lower() for name in names]
+    for _, score, idx in process.extract_iter(artist.lower(), lowered,
+                                              scorer=fuzz.ratio, score_cutoff=85):
+        if score > 85:
+            return names[idx]
+    return None
 
 
 def get_venue_info(venue_name: str, venues: dict) -> dict | None:
@@ -28,21 +114,53 @@ def get_venue_info(venue_name: str, venues: dict) -> dict | None:
     Strips parenthetical room suffixes (e.g. 'Elsewhere (Zone One)' → 'Elsewhere')
     before matching, so multi-room venues match their base entry.
     """
-    import re
-    base_name = re.sub(r'\s*\(.*\)\s*$', '', venue_name).strip()
-    for name, info in venues.items():
-        if (fuzz.ratio(venue_name.lower(), name.lower()) > 85 or
-                fuzz.ratio(base_name.lower(), name.lower()) > 85):
-            return info
-    return None
+    base_name = _ROOM_SUFFIX_RE.sub('', venue_name).strip()
+    name = fuzzy_venue_key((venue_name, base_name), tuple(venues))
+    return venues[name] if name is not None else None
+
+
+def event_artist_names(event) -> tuple[str, ...]:
+    """Artist entity values for an event, in entity order.
+
+    Both artist signals, novelty, seen-artist tracking and the explainers all
+    need these, so they are worked out once and kept on the event instance
+    where it accepts new attributes (not __slots__ or NamedTuple events).
+    """
+    names = getattr(event, "_artist_names", None)
+    if not isinstance(names, tuple):
+        entities = getattr(event, "entities", None) or ()
+        names = tuple(e.entity_value for e in entities if e.entity_type == "artist")
+        _remember_on(event, "_artist_names", names)
+    return names
+
+
+def event_artist_keys(event) -> frozenset[str]:
+    """Lowercased artist names for an event, the form novelty's seen-artist
+    set holds. Kept on the event instance like event_artist_names."""
+    keys = getattr(event, "_artist_keys", None)
+    if not isinstance(keys, frozenset):
+        keys = frozenset(a.lower() for a in event_artist_names(event))
+        _remember_on(event, "_artist_keys", keys)
+    return keys
+
+
+def _remember_on(event, attr: str, value):
+    try:
+        setattr(event, attr, value)
+    except AttributeError:  # __slots__ / NamedTuple event
+        pass
 
 
 def _load_taste_profile() -> dict:
-    """Load taste profile data (artist affinities, etc.)."""
+    """Load taste profile data (artist affinities, etc.).
+
+    Called by every artist signal for every event, so it goes through
+    load_yaml_cached; a sync script rewriting the file is picked up on the
+    next call.
+    """
     path = os.path.join(CONFIG_DIR, "taste_profile.yaml")
     if os.path.exists(path):
-        with open(path) as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_cached(path) or {}
     return {}
 
 
@@ -60,10 +178,8 @@ def category_signal(event, prefs: dict, venues: dict) -> float:
 def venue_reputation_signal(event, prefs: dict, venues: dict) -> float:
     """Score 0-10 based on venue boost from preferences."""
     venue_boosts = prefs.get("venue_boost") or {}
-    for vname, boost in venue_boosts.items():
-        if fuzz.ratio(event.venue_name.lower(), vname.lower()) > 85:
-            return float(boost)
-    return 0.0
+    vname = fuzzy_venue_key((event.venue_name,), tuple(venue_boosts))
+    return float(venue_boosts[vname]) if vname is not None else 0.0
 
 
 def vibe_alignment_signal(event, prefs: dict, venues: dict) -> float:
@@ -93,18 +209,17 @@ def listening_history_signal(event, prefs: dict, venues: dict) -> float:
     if not affinities:
         return 0.0
 
-    # Get artist names from event entities
-    artist_names = [e.entity_value for e in event.entities if e.entity_type == "artist"]
+    artist_names = event_artist_names(event)
     if not artist_names:
         return 0.0
 
+    known_artists = known_artist_names(profile, "artist_affinities", affinities)
+    lowered = lowered_artist_names(profile, "artist_affinities", known_artists)
     best_score = 0.0
     for artist in artist_names:
-        artist_lower = artist.lower()
-        for known_artist, affinity in affinities.items():
-            if fuzz.ratio(artist_lower, known_artist.lower()) > 85:
-                best_score = max(best_score, float(affinity))
-                break
+        known_artist = fuzzy_artist_key(artist, known_artists, lowered)
+        if known_artist is not None:
+            best_score = max(best_score, float(affinities[known_artist]))
 
     # Scale affinity (0-1) to signal score (0-10)
     return round(best_score * 10, 1)
@@ -123,19 +238,19 @@ def concert_history_signal(event, prefs: dict, venues: dict) -> float:
     if not artists:
         return 0.0
 
-    # Get artist names from event entities
-    artist_names = [e.entity_value for e in event.entities if e.entity_type == "artist"]
+    artist_names = event_artist_names(event)
     if not artist_names:
         return 0.0
 
+    known_artists = known_artist_names(profile, "concert_history", artists)
+    lowered = lowered_artist_names(profile, "concert_history", known_artists)
     best_score = 0.0
     for artist in artist_names:
-        artist_lower = artist.lower()
-        for known_artist, stats in artists.items():
-            if fuzz.ratio(artist_lower, known_artist.lower()) > 85:
-                affinity = float(stats["affinity"]) if isinstance(stats, dict) else float(stats)
-                best_score = max(best_score, affinity)
-                break
+        known_artist = fuzzy_artist_key(artist, known_artists, lowered)
+        if known_artist is not None:
+            stats = artists[known_artist]
+            affinity = float(stats["affinity"]) if isinstance(stats, dict) else float(stats)
+            best_score = max(best_score, affinity)
 
     # Scale affinity (0-1) to signal score (0-10)
     return round(best_score * 10, 1)
@@ -157,8 +272,23 @@ def score_taste(event, prefs: dict, venues: dict) -> float:
     return max(0, min(score, 20))
 
 
+# Travel bonus tiers for score_convenience
+_CLOSE_HOODS = frozenset({"west village", "greenwich village", "flatiron", "chelsea"})
+_NEARBY_HOODS = frozenset({"east village", "lower east side", "soho"})
+
+
+@functools.lru_cache(maxsize=8)
+def _cutoff_hour(cutoff_str: str) -> int:
+    """Hour of an "HH:MM" late cutoff from preferences.yaml."""
+    return int(cutoff_str.split(":")[0])
+
+
 def score_convenience(event, prefs: dict, venues: dict) -> float:
     """Score 0-25 based on time-of-day and travel."""
+    return _convenience(event, prefs, get_venue_info(event.venue_name, venues))
+
+
+def _convenience(event, prefs: dict, venue_info: dict | None) -> float:
     score = 15.0  # Start with a baseline
 
     start_dt = event.start_dt
@@ -171,15 +301,13 @@ def score_convenience(event, prefs: dict, venues: dict) -> float:
 
     # Time-of-day fit (0-15)
     if is_weekend:
-        cutoff_str = prefs.get("weekend_late_cutoff", "23:30")
         # Weekend: 18-23 ideal
         if 18 <= hour <= 23:
             score += 10
         elif hour > 23:
             score += 3
     else:
-        cutoff_str = prefs.get("weekday_late_cutoff", "22:30")
-        cutoff_hour = int(cutoff_str.split(":")[0])
+        cutoff_hour = _cutoff_hour(prefs.get("weekday_late_cutoff", "22:30"))
         # Weeknight: 19-21 ideal
         if 19 <= hour <= 21:
             score += 10
@@ -190,14 +318,13 @@ def score_convenience(event, prefs: dict, venues: dict) -> float:
 
     # Travel penalty — rough neighborhood distance heuristic
     home = prefs.get("home_neighborhood", "").lower()
-    venue_info = get_venue_info(event.venue_name, venues)
     if venue_info:
         venue_hood = venue_info.get("neighborhood", "").lower()
         if home == venue_hood:
             score += 5  # No travel
-        elif venue_hood in ("west village", "greenwich village", "flatiron", "chelsea"):
+        elif venue_hood in _CLOSE_HOODS:
             score += 3  # Close-ish to West Village
-        elif venue_hood in ("east village", "lower east side", "soho"):
+        elif venue_hood in _NEARBY_HOODS:
             score += 1
         # Further neighborhoods get no bonus
 
@@ -206,9 +333,12 @@ def score_convenience(event, prefs: dict, venues: dict) -> float:
 
 def score_social(event, prefs: dict, venues: dict) -> float:
     """Score 0-20 based on social/date fit."""
+    return _social(event, get_venue_info(event.venue_name, venues))
+
+
+def _social(event, venue_info: dict | None) -> float:
     score = 10.0
 
-    venue_info = get_venue_info(event.venue_name, venues)
     if venue_info:
         vibe_tags = venue_info.get("vibe_tags", [])
         if "date-friendly" in vibe_tags:
@@ -232,33 +362,66 @@ def score_social(event, prefs: dict, venues: dict) -> float:
 
 
 def score_novelty(event, seen_artists: set = None, seen_venues: set = None) -> float:
-    """Score 0-15 based on novelty."""
+    """Score 0-15 based on novelty.
+
+    `seen_artists` and `seen_venues` hold lowercased names (as built by
+    selector.score_and_rank); they are not lowered again here.
+    """
     score = 7.0  # Baseline
-    seen_artists = seen_artists or set()
-    seen_venues = seen_venues or set()
 
     # New artist bonus
-    artist_names = [e.entity_value for e in event.entities if e.entity_type == "artist"]
-    if artist_names:
-        if not any(a.lower() in seen_artists for a in artist_names):
+    artist_keys = event_artist_keys(event)
+    if artist_keys:
+        if not seen_artists or seen_artists.isdisjoint(artist_keys):
             score += 5
     else:
         score += 3  # Unknown artist — might be novel
 
     # Venue variety bonus
-    if event.venue_name.lower() not in seen_venues:
+    if not seen_venues or event.venue_name.lower() not in seen_venues:
         score += 3
 
     return max(0, min(score, 15))
 
 
+def combined_score(event, prefs: dict, venues: dict,
+                   seen_artists: set = None, seen_venues: set = None) -> float:
+    """Sum of taste, convenience, social and novelty for an event.
+
+    Unlike score_event (where convenience and social are disabled for now),
+    this adds all four sub-scores. The venue is looked up once and shared by
+    the convenience and social parts.
+    """
+    venue_info = get_venue_info(event.venue_name, venues)
+    return (score_taste(event, prefs, venues)
+            + _convenience(event, prefs, venue_info)
+            + _social(event, venue_info)
+            + score_novelty(event, seen_artists, seen_venues))
+
+
 def score_event(event, prefs: dict = None, venues: dict = None,
                 seen_artists: set = None, seen_venues: set = None) -> dict:
-    """Compute full score breakdown for an event."""
+    """Compute full score breakdown for an event.
+
+    "taste_raw" is the unrounded taste score, so selector.score_and_rank can
+    recompute "total" for a new novelty exactly as it is computed here.
+
+    This stays plain Python: the arithmetic here is a handful of dict lookups
+    per event, and the expensive part (fuzzy artist/venue matching) already
+    runs inside rapidfuzz against cached name lists.
+    """
     prefs = prefs or load_preferences()
     venues = venues or load_venues()
 
-    taste = score_taste(event, prefs, venues)
+    # Run each taste signal once; the match-reason breakdown reuses the values
+    taste_values = {signal: signal(event, prefs, venues) for signal in TASTE_SIGNALS}
+
+    def signal_value(signal) -> float:
+        if signal in taste_values:
+            return taste_values[signal]
+        return signal(event, prefs, venues)
+
+    taste = max(0, min(sum(taste_values.values()), 20))
     convenience = 0  # disabled — v2
     social = 0  # disabled — v2
     novelty = score_novelty(event, seen_artists, seen_venues)
@@ -266,8 +429,8 @@ def score_event(event, prefs: dict = None, venues: dict = None,
 
     # Collect individual signal values for match reasons
     signals = {
-        "artist_affinity": listening_history_signal(event, prefs, venues),
-        "concert_history": concert_history_signal(event, prefs, venues),
+        "artist_affinity": signal_value(listening_history_signal),
+        "concert_history": signal_value(concert_history_signal),
         "venue_reputation": venue_reputation_signal(event, prefs, venues),
         "category_weight": category_signal(event, prefs, venues),
         "home_neighborhood": _home_neighborhood_match(event, prefs, venues),
@@ -276,10 +439,13 @@ def score_event(event, prefs: dict = None, venues: dict = None,
     return {
         "total": round(total, 1),
         "taste": round(taste, 1),
+        "taste_raw": taste,
         "convenience": round(convenience, 1),
         "social": round(social, 1),
         "novelty": round(novelty, 1),
         "signals": signals,
+        # Radar membership, see selector.split_radar_and_lucky_dip
+        "has_artist_signal": signals["artist_affinity"] > 0 or signals["concert_history"] > 0,
     }
 
 
@@ -4,13 +4,21 @@ from __future__ import annotations
 from collections import Counter
 from datetime import datetime, timedelta
 
+from peewee import prefetch
+
 from db.models import Event, EventEntity
-from ranking.scorer import score_event, load_preferences, load_venues
+from ranking.scorer import (
+    score_event, score_novelty, event_artist_keys, load_preferences, load_venues,
+)
 
 
 def get_active_events(start: datetime, end: datetime):
-    """Fetch active events in a date range, with entities prefetched."""
-    events = list(
+    """Fetch active events in a date range, with entities prefetched.
+
+    prefetch() runs one query for the events and one for their entities, and
+    assigns each event's entities to `ev.entities` as a plain list.
+    """
+    query = (
         Event.select()
         .where(
             Event.status == "active",
@@ -19,31 +27,18 @@ def get_active_events(start: datetime, end: datetime):
         )
         .order_by(Event.start_dt)
     )
-    # Prefetch entities
-    if events:
-        entities = list(
-            EventEntity.select().where(EventEntity.event.in_([e.id for e in events]))
-        )
-        entity_map = {}
-        for ent in entities:
-            entity_map.setdefault(ent.event_id, []).append(ent)
-        for ev in events:
-            ev._prefetched_entities = entity_map.get(ev.id, [])
-    else:
-        for ev in events:
-            ev._prefetched_entities = []
-    return events
-
+    return prefetch(query, EventEntity)
 
-def _patch_entities(event):
-    """Make event.entities work with prefetched data."""
-    if hasattr(event, "_prefetched_entities"):
-        return event._prefetched_entities
-    return list(event.entities)
 
+def score_and_rank(events, prefs=None, venues=None, novelty_boost=1.0, score_cache=None):
+    """Score all events and return sorted (event, scores) pairs.
 
-def score_and_rank(events, prefs=None, venues=None, novelty_boost=1.0):
-    """Score all events and return sorted (event, scores) pairs."""
+    Events should be in start_dt order, since novelty depends on which
+    artists and venues came earlier in the list. If `score_cache` (a dict
+    keyed by event id) is given, an event scored by an earlier call only has
+    its novelty recomputed; everything else in score_event doesn't depend on
+    the other events.
+    """
     prefs = prefs or load_preferences()
     venues = venues or load_venues()
     seen_artists = set()
@@ -51,11 +46,18 @@ def score_and_rank(events, prefs=None, venues=None, novelty_boost=1.0):
 
     scored = []
     for ev in events:
-        # Patch entities for scoring
-        original_entities = ev.entities
-        ev.entities = _patch_entities(ev)
-        scores = score_event(ev, prefs, venues, seen_artists, seen_venues)
-        ev.entities = original_entities
+        cached = score_cache.get(ev.id) if score_cache is not None else None
+        if cached is None:
+            scores = score_event(ev, prefs, venues, seen_artists, seen_venues)
+            if score_cache is not None:
+                score_cache[ev.id] = dict(scores)
+        else:
+            scores = dict(cached)
+            novelty = score_novelty(ev, seen_artists, seen_venues)
+            scores["novelty"] = round(novelty, 1)
+            # Same sum score_event rounds, so the total doesn't depend on
+            # which window scored the event first
+            scores["total"] = round(scores.get("taste_raw", scores["taste"]) + novelty, 1)
 
         # Apply novelty boost (for wildcard selection)
         if novelty_boost != 1.0:
@@ -68,24 +70,48 @@ def score_and_rank(events, prefs=None, venues=None, novelty_boost=1.0):
         scored.append((ev, scores))
 
         # Track seen artists/venues
-        for ent in _patch_entities(ev):
-            if ent.entity_type == "artist":
-                seen_artists.add(ent.entity_value.lower())
+        seen_artists.update(event_artist_keys(ev))
         seen_venues.add(ev.venue_name.lower())
 
     scored.sort(key=lambda x: x[1]["total"], reverse=True)
     return scored
 
 
-def select_tonight(prefs=None, venues=None) -> list[tuple]:
+def _rank_window(start, end, prefs, venues, events=None, score_cache=None,
+                 novelty_boost=1.0) -> list[tuple]:
+    """score_and_rank the active events starting between start and end.
+
+    `events` is an already-fetched, start_dt-ordered superset of the window
+    (see select_all); without it the window is queried from the DB.
+    """
+    if events is None:
+        events = get_active_events(start, end)
+    else:
+        events = [ev for ev in events if _in_window(ev.start_dt, start, end)]
+    return score_and_rank(events, prefs, venues, novelty_boost, score_cache)
+
+
+def _in_window(start_dt, start: datetime, end: datetime) -> bool:
+    """start <= start_dt <= end, as the SQL window in get_active_events does it.
+
+    start_dt values peewee couldn't parse (e.g. with a UTC offset) come back
+    as strings, and offset-aware datetimes don't compare with naive ones;
+    both are compared as text, which is what SQLite does with them.
+    """
+    try:
+        return start <= start_dt <= end
+    except TypeError:
+        return str(start) <= str(start_dt) <= str(end)
+
+
+def select_tonight(prefs=None, venues=None, events=None, score_cache=None) -> list[tuple]:
     """Select top events for tonight (next 24 hours)."""
     prefs = prefs or load_preferences()
     venues = venues or load_venues()
     now = datetime.now()
     end = now + timedelta(hours=24)
 
-    events = get_active_events(now, end)
-    scored = score_and_rank(events, prefs, venues)
+    scored = _rank_window(now, end, prefs, venues, events, score_cache)
 
     min_score = prefs.get("selection", {}).get("min_score", 25)
     count = prefs.get("selection", {}).get("tonight_count", 5)
@@ -93,15 +119,14 @@ def select_tonight(prefs=None, venues=None) -> list[tuple]:
     return [(ev, s) for ev, s in scored if s["total"] >= min_score][:count]
 
 
-def select_this_week(prefs=None, venues=None) -> list[tuple]:
+def select_this_week(prefs=None, venues=None, events=None, score_cache=None) -> list[tuple]:
     """Select top events for this week (next 7 days), max 2 per venue."""
     prefs = prefs or load_preferences()
     venues = venues or load_venues()
     now = datetime.now()
     end = now + timedelta(days=7)
 
-    events = get_active_events(now, end)
-    scored = score_and_rank(events, prefs, venues)
+    scored = _rank_window(now, end, prefs, venues, events, score_cache)
 
     min_score = prefs.get("selection", {}).get("min_score", 25)
     count = prefs.get("selection", {}).get("week_count", 10)
@@ -123,7 +148,7 @@ def select_this_week(prefs=None, venues=None) -> list[tuple]:
     return result
 
 
-def select_coming_up(prefs=None, venues=None) -> list[tuple]:
+def select_coming_up(prefs=None, venues=None, events=None, score_cache=None) -> list[tuple]:
     """Select top events 1–6 weeks out (8–42 days), no venue cap.
 
     These are the 'buy tickets now' picks — events far enough out that
@@ -135,8 +160,7 @@ def select_coming_up(prefs=None, venues=None) -> list[tuple]:
     start = now + timedelta(days=8)
     end = now + timedelta(days=90)
 
-    events = get_active_events(start, end)
-    scored = score_and_rank(events, prefs, venues)
+    scored = _rank_window(start, end, prefs, venues, events, score_cache)
 
     min_score = prefs.get("selection", {}).get("min_score", 25)
     count = prefs.get("selection", {}).get("coming_up_count", 5)
@@ -144,15 +168,14 @@ def select_coming_up(prefs=None, venues=None) -> list[tuple]:
     return [(ev, s) for ev, s in scored if s["total"] >= min_score][:count]
 
 
-def select_wildcard(prefs=None, venues=None) -> tuple | None:
+def select_wildcard(prefs=None, venues=None, events=None, score_cache=None) -> tuple | None:
     """Select one wildcard pick with boosted novelty."""
     prefs = prefs or load_preferences()
     venues = venues or load_venues()
     now = datetime.now()
     end = now + timedelta(days=7)
 
-    events = get_active_events(now, end)
-    scored = score_and_rank(events, prefs, venues, novelty_boost=3.0)
+    scored = _rank_window(now, end, prefs, venues, events, score_cache, novelty_boost=3.0)
 
     min_score = prefs.get("selection", {}).get("min_score", 25)
 
@@ -179,6 +202,8 @@ def select_full_list(prefs=None, venues=None) -> list[tuple]:
 
 def _has_artist_signal(scores: dict) -> bool:
     """True if the event has any artist-based scoring signal."""
+    if "has_artist_signal" in scores:
+        return scores["has_artist_signal"]
     signals = scores.get("signals", {})
     return signals.get("artist_affinity", 0) > 0 or signals.get("concert_history", 0) > 0
 
@@ -196,17 +221,29 @@ def split_radar_and_lucky_dip(scored: list[tuple]) -> tuple[list[tuple], list[tu
         else:
             lucky_dip.append((ev, s))
 
-    radar.sort(key=lambda x: str(x[0].start_dt))
+    try:
+        radar.sort(key=lambda x: x[0].start_dt)
+    except TypeError:
+        # start_dt values peewee couldn't parse (e.g. with a UTC offset) come
+        # back as strings, and only compare with datetimes as text
+        radar.sort(key=lambda x: str(x[0].start_dt))
     return radar, lucky_dip
 
 
 def select_all() -> dict:
-    """Run all selectors and return the full digest data."""
+    """Run all selectors and return the full digest data.
+
+    The windows overlap, so events are fetched once for the widest one and
+    each event's non-novelty scores are computed once and shared.
+    """
     prefs = load_preferences()
     venues = load_venues()
+    now = datetime.now()
+    events = get_active_events(now, now + timedelta(days=90))
+    score_cache = {}
     return {
-        "tonight": select_tonight(prefs, venues),
-        "this_week": select_this_week(prefs, venues),
-        "coming_up": select_coming_up(prefs, venues),
-        "wildcard": select_wildcard(prefs, venues),
+        "tonight": select_tonight(prefs, venues, events, score_cache),
+        "this_week": select_this_week(prefs, venues, events, score_cache),
+        "coming_up": select_coming_up(prefs, venues, events, score_cache),
+        "wildcard": select_wildcard(prefs, venues, events, score_cache),
     }
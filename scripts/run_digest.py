@@ -8,14 +8,6 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv()
-
-from db.models import init_db
-from ranking.selector import select_full_list, split_radar_and_lucky_dip
-from ranking.scorer import load_preferences, load_venues
-from digest.web_renderer import render_web, render_full_list, render_lucky_dip
-
 
 def main():
     parser = argparse.ArgumentParser(description="NYC Scout — Generate daily web pages")
@@ -23,6 +15,17 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true")
     args = parser.parse_args()
 
+    # .env is read and the pipeline imported only after arg parsing, so --help
+    # and usage errors skip both. load_dotenv() must come first: db.models
+    # and friends read settings like DB_PATH from the environment on import.
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from db.models import init_db
+    from ranking.selector import select_full_list, split_radar_and_lucky_dip
+    from ranking.scorer import load_preferences, load_venues
+    from digest.web_renderer import render_web, render_full_list, render_lucky_dip
+
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -8,12 +8,6 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv()
-
-from ingestion.runner import run_ingestion, prune_low_scoring
-from ingestion.discovery import run_discovery, add_link
-
 
 def main():
     parser = argparse.ArgumentParser(description="NYC Scout — Ingest events from sources")
@@ -27,6 +21,15 @@ def main():
                         help="Full 90-day paginated pull (Ticketmaster), then prune low-scoring events")
     args = parser.parse_args()
 
+    # .env is read and the pipeline imported only after arg parsing, so --help
+    # and usage errors skip both. load_dotenv() must come first: db.models
+    # and friends read settings like DB_PATH from the environment on import.
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from ingestion.runner import run_ingestion, prune_low_scoring
+    from ingestion.discovery import run_discovery, add_link
+
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -17,20 +17,29 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import os
 import sys
+from collections import Counter
+from operator import itemgetter
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
 
+import orjson
 import yaml
-from bs4 import BeautifulSoup
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+
+from ingestion.base import json_ld_blocks
 
 logger = logging.getLogger(__name__)
 
-CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "config")
-PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_DIR = os.path.join(PROJECT_DIR, "config")
 
 # Default source files (relative to project root)
 SOURCE_FILES = [
@@ -50,6 +59,11 @@ MAX_AFFINITY = 1.0
 AFFINITY_BOOST = 0.10
 AFFINITY_DEFAULT = 0.6
 
+# Parsed concerts per source file, reused while the file's mtime and size
+# are unchanged
+CONCERT_CACHE_PATH = os.environ.get(
+    "CONCERT_CACHE_PATH", os.path.join(PROJECT_DIR, "data", "concert_cache.json"))
+
 
 def parse_gigography_html(filepath: str) -> list[dict]:
     """Parse a Songkick gigography HTML file.
@@ -58,13 +72,14 @@ def parse_gigography_html(filepath: str) -> list[dict]:
     Returns list of dicts with keys: artists, venue, date, city, title.
     """
     with open(filepath, encoding="utf-8") as f:
-        soup = BeautifulSoup(f.read(), "html.parser")
+        html = f.read()
 
     concerts = []
-    for script_tag in soup.find_all("script", type="application/ld+json"):
+    append = concerts.append  # bound once; the loop below can run thousands of times
+    for block in json_ld_blocks(html):
         try:
-            data = json.loads(script_tag.string)
-        except (json.JSONDecodeError, TypeError):
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
             continue
 
         # JSON-LD is wrapped in a list
@@ -74,53 +89,98 @@ def parse_gigography_html(filepath: str) -> list[dict]:
         if not isinstance(data, dict):
             continue
 
-        performers = data.get("performer", [])
+        get = data.get
+        performers = get("performer", [])
         if not isinstance(performers, list):
             performers = [performers]
 
-        artist_names = [p.get("name", "") for p in performers if p.get("name")]
+        artist_names = [name for p in performers if (name := p.get("name"))]
 
         # Skip festivals (10+ performers)
         if len(artist_names) >= FESTIVAL_THRESHOLD:
-            event_name = data.get("name", "Unknown")
+            event_name = get("name", "Unknown")
             logger.debug(f"  Skipping festival ({len(artist_names)} artists): {event_name}")
             continue
 
-        location = data.get("location", {})
+        location = get("location", {})
         venue_name = location.get("name", "")
         address = location.get("address", {})
         city = address.get("addressLocality", "")
         country = address.get("addressCountry", "")
-        date = data.get("startDate", "")
+        date = get("startDate", "")
 
-        # Extract just the date part (YYYY-MM-DD) from datetime strings
-        if "T" in date:
-            date = date.split("T")[0]
+        # Extract just the date part (YYYY-MM-DD) from datetime strings;
+        # slicing at find() avoids the throwaway list split() would build
+        t = date.find("T")
+        if t >= 0:
+            date = date[:t]
 
-        concerts.append({
+        append({
             "artists": artist_names,
             "venue": venue_name,
             "date": date,
             "city": f"{city}, {country}" if country else city,
-            "title": data.get("name", ""),
+            "title": get("name", ""),
         })
 
     logger.info(f"  Parsed {len(concerts)} concerts from {os.path.basename(filepath)}")
     return concerts
 
 
+def _load_concert_cache() -> dict:
+    """Read the parse cache; a missing, unreadable or non-dict file is empty."""
+    try:
+        with open(CONCERT_CACHE_PATH, "rb") as f:
+            cache = orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_concert_cache(cache: dict):
+    # Write-then-rename, so an interrupted run can't leave a truncated cache
+    os.makedirs(os.path.dirname(CONCERT_CACHE_PATH) or ".", exist_ok=True)
+    tmp = CONCERT_CACHE_PATH + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(cache))
+    os.replace(tmp, CONCERT_CACHE_PATH)
+
+
+def parse_gigography_cached(filepath: str, cache: dict) -> list[dict]:
+    """parse_gigography_html, reusing `cache` while the file is unchanged.
+
+    Entries are keyed by path and invalidated when mtime or size differ;
+    a fresh parse replaces the entry in `cache` (the caller saves it). An
+    entry of the wrong shape (e.g. from an older cache format) is a miss.
+    """
+    st = os.stat(filepath)
+    entry = cache.get(filepath)
+    if (isinstance(entry, dict)
+            and entry.get("mtime") == st.st_mtime
+            and entry.get("size") == st.st_size
+            and isinstance(entry.get("concerts"), list)):
+        logger.info(f"  Using cached parse of {os.path.basename(filepath)}")
+        return entry["concerts"]
+    concerts = parse_gigography_html(filepath)
+    cache[filepath] = {"mtime": st.st_mtime, "size": st.st_size, "concerts": concerts}
+    return concerts
+
+
 def compute_artist_stats(all_concerts: list[dict]) -> dict[str, dict]:
     """Compute per-artist attendance counts and affinities.
 
     Returns dict mapping artist name to {affinity, seen}.
     """
-    artist_counts: dict[str, int] = {}
+    artist_counts = Counter()
     for concert in all_concerts:
-        for artist in concert["artists"]:
-            artist_counts[artist] = artist_counts.get(artist, 0) + 1
+        artist_counts.update(concert["artists"])
+
+    # Most seen first, ties alphabetical: sort by name, then stably by count
+    ranked = sorted(artist_counts.items(), key=itemgetter(0))
+    ranked.sort(key=itemgetter(1), reverse=True)
 
     artists = {}
-    for name, count in sorted(artist_counts.items(), key=lambda x: (-x[1], x[0])):
+    for name, count in ranked:
         affinity = min(BASE_AFFINITY + REPEAT_BONUS * (count - 1), MAX_AFFINITY)
         artists[name] = {"affinity": round(affinity, 1), "seen": count}
 
@@ -138,32 +198,35 @@ def boost_artist_affinities(
     - New artists: added at 0.6
     - All concert artists added to manual_artists so Last.fm sync won't overwrite
     """
-    boosted = dict(existing_affinities)
-    manual_set = set(manual_artists)
+    # Build (name, affinity) pairs once: existing artists (boosted if seen
+    # live) in their current order, then new concert artists
+    ranked = [
+        (name, min(1.0, round(score + AFFINITY_BOOST, 3)) if name in concert_artists else score)
+        for name, score in existing_affinities.items()
+    ]
+    ranked.extend((name, AFFINITY_DEFAULT) for name in concert_artists
+                  if name not in existing_affinities)
 
-    for name in concert_artists:
-        if name in boosted:
-            boosted[name] = min(1.0, round(boosted[name] + AFFINITY_BOOST, 3))
-        else:
-            boosted[name] = AFFINITY_DEFAULT
-        manual_set.add(name)
+    # Affinity descending; the stable sort keeps ties in the order above
+    ranked.sort(key=itemgetter(1), reverse=True)
 
-    # Re-sort by affinity descending
-    boosted = dict(sorted(boosted.items(), key=lambda x: -x[1]))
-
-    return boosted, sorted(manual_set)
+    return dict(ranked), sorted({*manual_artists, *concert_artists})
 
 
 def sync_concert_history(dry_run: bool = False) -> dict:
     """Parse Songkick HTML files and write concert history to taste_profile.yaml."""
     # Parse all source files
     all_concerts = []
+    cache = _load_concert_cache()
+    cached = dict(cache)
     for relpath in SOURCE_FILES:
         filepath = os.path.join(PROJECT_DIR, relpath)
         if not os.path.exists(filepath):
             logger.warning(f"  Source file not found: {relpath}")
             continue
-        all_concerts.extend(parse_gigography_html(filepath))
+        all_concerts.extend(parse_gigography_cached(filepath, cache))
+    if cache != cached:
+        _save_concert_cache(cache)
 
     if not all_concerts:
         logger.error("No concerts parsed from any source file")
@@ -188,16 +251,13 @@ def sync_concert_history(dry_run: bool = False) -> dict:
     # Load existing taste profile
     path = os.path.join(CONFIG_DIR, "taste_profile.yaml")
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=YamlLoader) or {}
 
     # Write concert_history section
-    # Convert artist stats to simple dicts for YAML serialization
-    concert_artists_yaml = {}
-    for name, stats in artist_stats.items():
-        concert_artists_yaml[name] = {
-            "affinity": stats["affinity"],
-            "seen": stats["seen"],
-        }
+    concert_artists_yaml = {
+        name: {"affinity": stats["affinity"], "seen": stats["seen"]}
+        for name, stats in artist_stats.items()
+    }
 
     data["concert_history"] = {
         "artists": concert_artists_yaml,
@@ -216,8 +276,8 @@ def sync_concert_history(dry_run: bool = False) -> dict:
     data["manual_artists"] = updated_manual
 
     with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False,
-                  allow_unicode=True)
+        yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False,
+                  sort_keys=False, allow_unicode=True)
 
     logger.info(f"Wrote concert_history ({total_concerts} concerts) to taste_profile.yaml")
     logger.info(f"Boosted {len(artist_stats)} artists in artist_affinities")
@@ -19,14 +19,23 @@ import logging
 import math
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import orjson
 import requests
 import yaml
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-load_dotenv()
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
 
 logger = logging.getLogger(__name__)
 
@@ -40,37 +49,80 @@ RECENT_PERIOD = "6month"      # Last.fm period for recency
 RECENT_LIMIT = 100            # Max recent artists to fetch
 RECENT_BOOST_MAX = 0.3        # Max bonus for recent listening
 LASTFM_USERNAME = "dustpunk"
+LASTFM_MAX_WORKERS = 4        # Concurrent page requests
+LASTFM_MAX_RPS = 5            # Last.fm allows ~5 req/s per API key
+
+# Shared so page requests reuse keep-alive connections. Rate limiting (429)
+# and transient 5xx responses are retried with backoff before
+# raise_for_status() sees them.
+_session = requests.Session()
+_session.headers["User-Agent"] = "ny-scout/1.0"
+_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=LASTFM_MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False),
+))
+
+# Request starts are spaced at least 1/LASTFM_MAX_RPS apart across workers:
+# the pool caps concurrency, but fast responses could still exceed the rate
+_rate_lock = threading.Lock()
+_next_request = 0.0
+
+
+def _wait_for_request_slot():
+    global _next_request
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request - now
+        _next_request = max(now, _next_request) + 1 / LASTFM_MAX_RPS
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _fetch_top_artists_page(api_key: str, period: str, per_page: int, page: int) -> dict:
+    _wait_for_request_slot()
+    resp = _session.get(LASTFM_API, params={
+        "method": "user.gettopartists",
+        "user": LASTFM_USERNAME,
+        "api_key": api_key,
+        "format": "json",
+        "period": period,
+        "limit": per_page,
+        "page": page,
+    }, timeout=15)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 
 def fetch_top_artists(api_key: str, period: str = "overall",
                       limit: int = 200) -> list[dict]:
-    """Fetch top artists from Last.fm for a given period."""
-    all_artists = []
-    page = 1
+    """Fetch top artists from Last.fm for a given period.
+
+    Page 1 says how many pages exist; the rest of the pages needed to reach
+    `limit` are then fetched concurrently.
+    """
     per_page = min(limit, 200)  # Last.fm max per page
 
-    while len(all_artists) < limit:
-        resp = requests.get(LASTFM_API, params={
-            "method": "user.gettopartists",
-            "user": LASTFM_USERNAME,
-            "api_key": api_key,
-            "format": "json",
-            "period": period,
-            "limit": per_page,
-            "page": page,
-        }, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-
-        artists = data.get("topartists", {}).get("artist", [])
-        if not artists:
-            break
-
-        all_artists.extend(artists)
-        total_pages = int(data["topartists"]["@attr"]["totalPages"])
-        if page >= total_pages:
-            break
-        page += 1
+    data = _fetch_top_artists_page(api_key, period, per_page, 1)
+    all_artists = data.get("topartists", {}).get("artist", [])
+    if not all_artists:
+        return []
+
+    total_pages = int(data["topartists"]["@attr"]["totalPages"])
+    last_page = min(total_pages, math.ceil(limit / per_page))
+    if last_page > 1:
+        with ThreadPoolExecutor(max_workers=LASTFM_MAX_WORKERS) as pool:
+            pages = pool.map(
+                lambda page: _fetch_top_artists_page(api_key, period, per_page, page),
+                range(2, last_page + 1),
+            )
+            for data in pages:
+                artists = data.get("topartists", {}).get("artist", [])
+                if not artists:
+                    break
+                all_artists.extend(artists)
 
     return all_artists[:limit]
 
@@ -87,32 +139,38 @@ def compute_affinities(alltime: list[dict], recent: list[dict]) -> dict[str, flo
     if not alltime:
         return {}
 
-    # Filter all-time to minimum plays
-    alltime = [a for a in alltime if int(a["playcount"]) >= MIN_ALLTIME_PLAYS]
+    # Parse play counts once and filter all-time to minimum plays. Names are
+    # interned so the same artist from the all-time and recent charts (and
+    # from manual_artists later) shares one key object.
+    alltime = [(sys.intern(a["name"]), plays) for a in alltime
+               if (plays := int(a["playcount"])) >= MIN_ALLTIME_PLAYS]
     if not alltime:
         return {}
 
-    max_plays = int(alltime[0]["playcount"])
-    log_max = math.log1p(max_plays)
+    log_max = math.log1p(alltime[0][1])
 
-    # Base affinities from all-time plays (power-law curve)
+    # Base affinities from all-time plays (power-law curve). The long tail
+    # shares a handful of small play counts, so each count is scored once.
+    base_by_plays = {}
     affinities = {}
-    for a in alltime:
-        plays = int(a["playcount"])
-        # log scale gives 0.0–1.0, then power curve steepens the drop-off
-        # so the long tail of casual listens scores much lower
-        log_score = math.log1p(plays) / log_max
-        base = 0.1 + (log_score ** 2.5) * 0.85
-        affinities[a["name"]] = round(base, 3)
+    for name, plays in alltime:
+        base = base_by_plays.get(plays)
+        if base is None:
+            # log scale gives 0.0–1.0, then power curve steepens the drop-off
+            # so the long tail of casual listens scores much lower
+            log_score = math.log1p(plays) / log_max
+            base = base_by_plays[plays] = round(0.1 + (log_score ** 2.5) * 0.85, 3)
+        affinities[name] = base
 
     # Recency boost
     if recent:
         max_recent = int(recent[0]["playcount"])
+        n_recent = len(recent)
         for i, a in enumerate(recent):
-            name = a["name"]
+            name = sys.intern(a["name"])
             recent_plays = int(a["playcount"])
             # Boost scales with position in recent chart and play count
-            position_factor = 1.0 - (i / len(recent))  # 1.0 for #1, 0.0 for last
+            position_factor = 1.0 - (i / n_recent)  # 1.0 for #1, 0.0 for last
             play_factor = recent_plays / max_recent
             boost = RECENT_BOOST_MAX * position_factor * play_factor
 
@@ -134,7 +192,7 @@ def sync_taste_profile(affinities: dict[str, float], dry_run: bool = False) -> d
     path = os.path.join(CONFIG_DIR, "taste_profile.yaml")
 
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=YamlLoader) or {}
 
     existing = data.get("artist_affinities", {}) or {}
     manual = data.get("manual_overrides", set())
@@ -164,12 +222,8 @@ def sync_taste_profile(affinities: dict[str, float], dry_run: bool = False) -> d
             new_count += 1
 
     # Keep any manual entries not in the new affinities
-    for name in manual_artists:
-        if name not in merged and name in existing:
-            merged[name] = existing[name]
-
-    # Sort by affinity descending
-    merged = dict(sorted(merged.items(), key=lambda x: -x[1]))
+    merged.update((name, existing[name]) for name in manual_artists - merged.keys()
+                  if name in existing)
 
     stats = {
         "total_artists": len(merged),
@@ -178,6 +232,19 @@ def sync_taste_profile(affinities: dict[str, float], dry_run: bool = False) -> d
         "manual_preserved": len(manual_artists),
     }
 
+    # Nothing changed since the last sync: skip the sort and the rewrite
+    if (not dry_run and merged == existing
+            and data.get("lastfm_synced")
+            and data.get("lastfm_username") == LASTFM_USERNAME
+            and data.get("manual_artists") == sorted(manual_artists)):
+        logger.info("No affinity changes; taste_profile.yaml left as is")
+        return stats
+
+    # Sort by affinity descending (stable, so ties keep merge order)
+    ranked = list(merged.items())
+    ranked.sort(key=itemgetter(1), reverse=True)
+    merged = dict(ranked)
+
     if dry_run:
         logger.info(f"Dry run — would write {len(merged)} artists")
         for name, score in list(merged.items())[:20]:
@@ -193,8 +260,8 @@ def sync_taste_profile(affinities: dict[str, float], dry_run: bool = False) -> d
     data["manual_artists"] = sorted(manual_artists)
 
     with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False,
-                  allow_unicode=True)
+        yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False,
+                  sort_keys=False, allow_unicode=True)
 
     logger.info(f"Wrote {len(merged)} artist affinities to taste_profile.yaml")
     return stats
@@ -206,6 +273,10 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Show what would change without writing")
     args = parser.parse_args()
 
+    # Read .env only once arguments are valid; --help exits before this
+    from dotenv import load_dotenv
+    load_dotenv()
+
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -1,15 +1,24 @@
 """Tests for deduplication logic."""
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
-from ingestion.runner import normalize_title
+import pytest
+
+from db.models import Event, Source, db, init_db
+from ingestion.runner import enrich_events, normalize_title
 from rapidfuzz import fuzz
 
 
+@pytest.fixture(scope="module")
+def titles():
+    """Titles normalized once for the whole module."""
+    return {
+        "monder": normalize_title("Ben Monder Trio"),
+        "monder_possessive": normalize_title("Ben Monder's Trio"),
+        "mehldau": normalize_title("Brad Mehldau Solo"),
+    }
+
+
 class TestFuzzyMatching:
     def test_exact_venue_match(self):
         assert fuzz.ratio("village vanguard", "village vanguard") == 100
@@ -22,20 +31,14 @@ class TestFuzzyMatching:
         score = fuzz.ratio("village vanguard", "smalls jazz club")
         assert score < 50
 
-    def test_title_match_same_event(self):
-        t1 = normalize_title("Ben Monder Trio")
-        t2 = normalize_title("Ben Monder Trio")
-        assert fuzz.ratio(t1, t2) == 100
+    def test_title_match_same_event(self, titles):
+        assert fuzz.ratio(titles["monder"], normalize_title("Ben Monder Trio")) == 100
 
-    def test_title_match_slight_diff(self):
-        t1 = normalize_title("Ben Monder Trio")
-        t2 = normalize_title("Ben Monder's Trio")
-        assert fuzz.ratio(t1, t2) > 85
+    def test_title_match_slight_diff(self, titles):
+        assert fuzz.ratio(titles["monder"], titles["monder_possessive"]) > 85
 
-    def test_title_match_different_events(self):
-        t1 = normalize_title("Ben Monder Trio")
-        t2 = normalize_title("Brad Mehldau Solo")
-        assert fuzz.ratio(t1, t2) < 60
+    def test_title_match_different_events(self, titles):
+        assert fuzz.ratio(titles["monder"], titles["mehldau"]) < 60
 
 
 class TestTimeWindow:
@@ -56,3 +59,33 @@ class TestTimeWindow:
         dt2 = datetime(2025, 3, 15, 20, 0)
         diff = abs((dt1 - dt2).total_seconds())
         assert diff <= 7200
+
+
+class TestEnrichEvents:
+    VENUES = {
+        "Village Vanguard": {"neighborhood": "West Village", "lat": 40.736, "lon": -74.001},
+        "Elsewhere": {"neighborhood": "Bushwick"},
+    }
+
+    def setup_method(self):
+        init_db(":memory:")
+        self.src = Source.create(name="test", type="ics", url="https://example.com")
+
+    def teardown_method(self):
+        db.close()
+
+    def _event(self, venue_name):
+        return Event.create(source=self.src, source_event_id=venue_name, title="Show",
+                            venue_name=venue_name, start_dt=datetime(2025, 3, 15, 20, 0))
+
+    def test_fuzzy_match_on_full_venue_name(self):
+        self._event("Village Vanguard")
+        self._event("The Village Vanguard")
+        self._event("Elsewhere (Zone One)")  # ratio 62 against "Elsewhere": no match
+        assert enrich_events(self.VENUES) == 2
+        hoods = {ev.venue_name: ev.neighborhood for ev in Event.select()}
+        assert hoods == {
+            "Village Vanguard": "West Village",
+            "The Village Vanguard": "West Village",
+            "Elsewhere (Zone One)": "",
+        }
@@ -1,11 +1,10 @@
 """Tests for source discovery: classification, extraction, and registration."""
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import json
+import re
 import tempfile
 import shutil
+import time
 from unittest.mock import patch, MagicMock
 
 import yaml
@@ -126,6 +125,14 @@ class TestClassifyPage:
         result = classify_page("https://example.com/about", html)
         assert result["type"] == "unknown"
 
+    def test_page_without_links_not_parsed(self):
+        html = make_html(title="About Us")
+        with patch("ingestion.discovery._soup") as mock_soup:
+            result = classify_page("https://example.com/about", html)
+        assert mock_soup.call_count == 0
+        assert result["venue_name"] == "Example"
+        assert result == classify_page("https://example.com/about", html + "<a href='/x'>x</a>")
+
     def test_og_site_name_extracted(self):
         html = make_html(og_site="Barbès")
         result = classify_page("https://barbesbrooklyn.com/events", html)
@@ -452,7 +459,7 @@ class TestFollowLinks:
         # Build sub-page HTML with JSON-LD
         sub_page_html = make_html(json_ld=SINGLE_EVENT_JSONLD)
 
-        with patch("ingestion.sources.generic.requests.get") as mock_get:
+        with patch("ingestion.sources.generic.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.text = sub_page_html
             mock_resp.raise_for_status = MagicMock()
@@ -472,7 +479,7 @@ class TestFollowLinks:
         listing_html = make_html(event_links=links)
         sub_page_html = make_html(json_ld=SINGLE_EVENT_JSONLD)
 
-        with patch("ingestion.sources.generic.requests.get") as mock_get:
+        with patch("ingestion.sources.generic.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.text = sub_page_html
             mock_resp.raise_for_status = MagicMock()
@@ -503,7 +510,7 @@ class TestFollowLinks:
             mock_resp.raise_for_status = MagicMock()
             return mock_resp
 
-        with patch("ingestion.sources.generic.requests.get", side_effect=side_effect):
+        with patch("ingestion.sources.generic.requests.Session.get", side_effect=side_effect):
             events = adapter._parse_follow_links(listing_html)
 
         assert len(events) == 2  # 2 successful, 1 failed
@@ -521,7 +528,7 @@ class TestFollowLinks:
         )
         sub_page_html = make_html(json_ld=SINGLE_EVENT_JSONLD)
 
-        with patch("ingestion.sources.generic.requests.get") as mock_get:
+        with patch("ingestion.sources.generic.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.text = sub_page_html
             mock_resp.raise_for_status = MagicMock()
@@ -545,7 +552,7 @@ class TestFollowLinks:
         )
         sub_page_html = make_html(json_ld=SINGLE_EVENT_JSONLD)
 
-        with patch("ingestion.sources.generic.requests.get") as mock_get:
+        with patch("ingestion.sources.generic.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.text = sub_page_html
             mock_resp.raise_for_status = MagicMock()
@@ -569,7 +576,7 @@ class TestFollowLinks:
         listing_html = make_html(event_links=["/shows/mystery"])
         sub_page_html = make_html(json_ld=no_url_jsonld)
 
-        with patch("ingestion.sources.generic.requests.get") as mock_get:
+        with patch("ingestion.sources.generic.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.text = sub_page_html
             mock_resp.raise_for_status = MagicMock()
@@ -580,6 +587,55 @@ class TestFollowLinks:
         assert len(events) == 1
         assert events[0]["ticket_url"] == "https://example.com/shows/mystery"
 
+    def test_link_pattern_ignored_by_other_strategies(self):
+        """A bad link_pattern only matters to follow_links sources."""
+        from ingestion.sources.generic import Adapter
+        adapter = Adapter({
+            "name": "test_jsonld",
+            "url": "https://example.com/shows",
+            "extraction": {"strategy": "json_ld", "link_pattern": "/shows/("},
+        })
+        assert adapter.link_re is None
+        with pytest.raises(re.error):
+            self._make_adapter(link_pattern="/shows/(")
+
+    def test_concurrent_fetches_keep_link_order(self):
+        """Sub-pages fetched in parallel still yield events in link order."""
+        adapter = self._make_adapter(fetch_delay=0, max_workers=3)
+        listing_html = make_html(event_links=["/shows/a", "/shows/b", "/shows/c"])
+
+        def side_effect(url, **kwargs):
+            slug = url.rsplit("/", 1)[-1]
+            # Later links answer first
+            time.sleep({"a": 0.06, "b": 0.03, "c": 0.0}[slug])
+            mock_resp = MagicMock()
+            mock_resp.text = make_html(json_ld=json.dumps({
+                "@type": "MusicEvent", "name": f"Show {slug}",
+                "startDate": "2026-04-01T20:00:00", "location": {"name": "Cool Venue"},
+            }))
+            return mock_resp
+
+        with patch("ingestion.sources.generic.requests.Session.get", side_effect=side_effect):
+            events = adapter._parse_follow_links(listing_html)
+
+        assert [e["title"] for e in events] == ["Show a", "Show b", "Show c"]
+
+    def test_one_pooled_session_per_parse(self):
+        """All sub-page fetches share one session whose pool fits the workers."""
+        from ingestion.sources.generic import HTTPAdapter
+        adapter = self._make_adapter(fetch_delay=0, max_workers=2)
+        listing_html = make_html(event_links=["/shows/a", "/shows/b", "/shows/c"])
+        mock_resp = MagicMock(text=make_html(json_ld=SINGLE_EVENT_JSONLD))
+
+        with patch("ingestion.sources.generic.requests.Session.get", autospec=True,
+                   return_value=mock_resp) as mock_get, \
+                patch("ingestion.sources.generic.HTTPAdapter", wraps=HTTPAdapter) as mock_adapter:
+            adapter._parse_follow_links(listing_html)
+
+        assert len({c.args[0] for c in mock_get.call_args_list}) == 1
+        assert mock_get.call_count == 3
+        mock_adapter.assert_called_once_with(pool_connections=2, pool_maxsize=2)
+
 
 class TestProbeSourceFollowLinks:
     """Test that probe_source recommends follow_links for listing pages."""
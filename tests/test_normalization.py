@@ -1,11 +1,7 @@
 """Tests for title normalization and date parsing."""
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from ingestion.runner import normalize_title
-from ingestion.base import BaseAdapter
+from ingestion.base import BaseAdapter, artist_entity, json_ld_blocks
 
 
 class TestNormalizeTitle:
@@ -35,6 +31,14 @@ class TestParseDatetime:
         dt = BaseAdapter.parse_datetime("2025-03-15")
         assert dt == datetime(2025, 3, 15, 0, 0, 0)
 
+    def test_iso_with_offset(self):
+        dt = BaseAdapter.parse_datetime("2025-03-15T20:30:00-04:00")
+        assert dt == datetime(2025, 3, 15, 20, 30, 0, tzinfo=timezone(timedelta(hours=-4)))
+
+    def test_iso_without_seconds(self):
+        dt = BaseAdapter.parse_datetime("2025-03-15T20:30")
+        assert dt == datetime(2025, 3, 15, 20, 30, 0)
+
     def test_us_format(self):
         dt = BaseAdapter.parse_datetime("03/15/2025 8:30 PM")
         assert dt == datetime(2025, 3, 15, 20, 30, 0)
@@ -55,3 +59,31 @@ class TestParseDatetime:
     def test_datetime_passthrough(self):
         dt = datetime(2025, 3, 15, 20, 30)
         assert BaseAdapter.parse_datetime(dt) is dt
+
+
+class TestJsonLdBlocks:
+    def test_extracts_only_json_ld(self):
+        html = (
+            '<script>var x = 1;</script>'
+            '<script type="application/ld+json">{"a": 1}</script>'
+            "<SCRIPT id='ld' TYPE='application/ld+json'>[{\"b\":\n2}]</SCRIPT>"
+        )
+        assert json_ld_blocks(html) == ['{"a": 1}', '[{"b":\n2}]']
+
+    def test_unquoted_type_falls_back_to_soup(self):
+        html = ('<script type="application/ld+json">{"a": 1}</script>'
+                '<script type=application/ld+json>{"c": 3}</script>')
+        assert json_ld_blocks(html) == ['{"a": 1}', '{"c": 3}']
+
+    def test_no_json_ld(self):
+        assert json_ld_blocks("<html><script>var x;</script></html>") == []
+
+
+class TestArtistEntity:
+    def test_fresh_dict_per_call(self):
+        first = artist_entity("Bill Frisell")
+        first["value"] = "changed"
+        assert artist_entity("Bill Frisell") == {"type": "artist", "value": "Bill Frisell"}
+
+    def test_unhashable_name_passed_through(self):
+        assert artist_entity({"name": "x"}) == {"type": "artist", "value": {"name": "x"}}
@@ -1,249 +1,497 @@
 """Tests for scoring and selection logic."""
-import sys
+import functools
+import json
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from datetime import datetime
-from unittest.mock import MagicMock, patch
-
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import NamedTuple
+from unittest.mock import ANY, MagicMock, patch
+
+import pytest
+
+from config import load_yaml_cached
+from db.models import Event, Source, db, init_db
 from ranking.scorer import (
-    score_taste, score_convenience, score_social, score_novelty,
+    score_taste, score_convenience, score_social, score_novelty, combined_score, score_event,
     load_preferences, load_venues, concert_history_signal,
+    get_venue_info, fuzzy_venue_key, fuzzy_artist_key,
+    _load_taste_profile, known_artist_names, lowered_artist_names,
+    event_artist_names, event_artist_keys,
+)
+from ranking.selector import score_and_rank, select_all, split_radar_and_lucky_dip
+from ranking import explainer
+from ranking.explainer import (
+    match_reasons, explain_template, explain_templates_bulk, explain_events,
 )
-from ranking.explainer import match_reasons
+
+
+# Parsed once for the whole module; scorers treat them as read-only
+@pytest.fixture(scope="module")
+def prefs():
+    return load_preferences()
+
+
+@pytest.fixture(scope="module")
+def venues():
+    return load_venues()
+
+
+class FakeEntity(NamedTuple):
+    """Plain stand-in for an EventEntity row."""
+    entity_type: str
+    entity_value: str
+
+
+@dataclass
+class FakeEvent:
+    """Plain stand-in for an Event row (attribute reads are plain lookups,
+    unlike MagicMock's child-mock machinery)."""
+    title: str = "Test Event"
+    venue_name: str = "Village Vanguard"
+    category: str = "jazz"
+    neighborhood: str = "West Village"
+    start_dt: datetime = datetime(2025, 3, 15, 20, 30)
+    end_dt: datetime | None = None
+    price_min: float | None = 25.0
+    price_max: float | None = None
+    entities: tuple = ()
+    id: int = 1
+    raw_hash: str = ""
 
 
 def _make_event(**kwargs):
-    """Create a mock event for testing."""
-    ev = MagicMock()
-    ev.title = kwargs.get("title", "Test Event")
-    ev.venue_name = kwargs.get("venue_name", "Village Vanguard")
-    ev.category = kwargs.get("category", "jazz")
-    ev.neighborhood = kwargs.get("neighborhood", "West Village")
-    ev.start_dt = kwargs.get("start_dt", datetime(2025, 3, 15, 20, 30))
-    ev.end_dt = kwargs.get("end_dt", None)
-    ev.price_min = kwargs.get("price_min", 25.0)
-    ev.price_max = kwargs.get("price_max", None)
-    ev.entities = kwargs.get("entities", [])
-    ev.id = kwargs.get("id", 1)
-    return ev
+    """Create a stand-in event for testing."""
+    return FakeEvent(**kwargs)
 
 
-class TestTasteScore:
-    def setup_method(self):
-        self.prefs = load_preferences()
-        self.venues = load_venues()
+@functools.lru_cache(maxsize=128)
+def _artist(name):
+    """Artist entity; repeated names share one instance."""
+    return FakeEntity("artist", name)
+
+
+# Seen sets as score_and_rank builds them: lowercased names
+_SEEN = frozenset({"repeat artist"})
+_EMPTY = frozenset()
+
+# Taste profile returned by the patched _load_taste_profile (read-only)
+MOCK_PROFILE = MappingProxyType({
+    "concert_history": {
+        "artists": {
+            "Makaya McCraven": {"affinity": 0.9, "seen": 3},
+            "IDLES": {"affinity": 0.9, "seen": 3},
+            "Jon Hopkins": {"affinity": 0.7, "seen": 1},
+        },
+    },
+})
 
-    def test_no_artist_match_scores_zero(self):
+
+class TestTasteScore:
+    def test_no_artist_match_scores_zero(self, prefs, venues):
         """Events with no artist affinity get 0 taste score."""
         ev = _make_event(venue_name="Village Vanguard", category="jazz")
-        score = score_taste(ev, self.prefs, self.venues)
+        score = score_taste(ev, prefs, venues)
         assert score == 0  # No artist entities = no taste signal
 
-    def test_artist_match_scores_positive(self):
+    def test_artist_match_scores_positive(self, prefs, venues):
         """Events with a matched artist get a positive taste score."""
-        entity = MagicMock()
-        entity.entity_type = "artist"
-        entity.entity_value = "Radiohead"
+        entity = _artist("Radiohead")
         ev = _make_event(entities=[entity])
-        score = score_taste(ev, self.prefs, self.venues)
+        score = score_taste(ev, prefs, venues)
         assert score > 0
 
 
 class TestConvenienceScore:
-    def setup_method(self):
-        self.prefs = load_preferences()
-        self.venues = load_venues()
-
-    def test_weeknight_830pm_good(self):
-        ev = _make_event(start_dt=datetime(2025, 3, 12, 20, 30))  # Wednesday 8:30 PM
-        score = score_convenience(ev, self.prefs, self.venues)
-        assert score >= 15
-
-    def test_weekend_evening_good(self):
-        ev = _make_event(start_dt=datetime(2025, 3, 15, 21, 0))  # Saturday 9 PM
-        score = score_convenience(ev, self.prefs, self.venues)
-        assert score >= 15
+    @pytest.mark.parametrize("start_dt, venue_name, floor", [
+        (datetime(2025, 3, 12, 20, 30), "Village Vanguard", 15),  # Wednesday 8:30 PM
+        (datetime(2025, 3, 15, 21, 0), "Village Vanguard", 15),   # Saturday 9 PM
+        (datetime(2025, 3, 15, 20, 30), "Village Vanguard", 20),  # Close to home
+    ])
+    def test_convenience_floor(self, prefs, venues, start_dt, venue_name, floor):
+        ev = _make_event(start_dt=start_dt, venue_name=venue_name)
+        assert score_convenience(ev, prefs, venues) >= floor
+
+
+class TestYamlCache:
+    def test_reparses_only_when_file_changes(self, tmp_path):
+        path = tmp_path / "prefs.yaml"
+        path.write_text("home_neighborhood: West Village\n")
+        first = load_yaml_cached(str(path))
+        assert load_yaml_cached(str(path)) is first
+
+        path.write_text("home_neighborhood: Bushwick, Brooklyn\n")
+        assert load_yaml_cached(str(path)) == {"home_neighborhood": "Bushwick, Brooklyn"}
+
+    def test_no_yaml_in_hot_path(self, prefs, venues):
+        """Once the config is loaded, scoring must not parse YAML again."""
+        ev = _make_event(entities=[_artist("IDLES")])
+        load_preferences()
+        load_venues()
+        with patch("config.yaml.load",
+                   side_effect=AssertionError("YAML parsed in scoring hot path")):
+            for _ in range(100):
+                score_convenience(ev, prefs, venues)
+                score_event(ev)
+
+
+class TestVenueLookup:
+    VENUES = {
+        "Elsewhere": {"neighborhood": "Bushwick"},
+        "Village Vanguard": {"neighborhood": "West Village"},
+    }
 
-    def test_home_neighborhood_bonus(self):
-        ev = _make_event(
-            venue_name="Village Vanguard",
-            start_dt=datetime(2025, 3, 15, 20, 30),
-        )
-        score = score_convenience(ev, self.prefs, self.venues)
-        assert score >= 20  # Close to home
+    def test_room_suffix_matches_base_venue(self):
+        info = get_venue_info("Elsewhere (Zone One)", self.VENUES)
+        assert info == {"neighborhood": "Bushwick"}
+
+    def test_case_insensitive_and_unknown(self):
+        assert fuzzy_venue_key(("VILLAGE VANGUARD",), tuple(self.VENUES)) == "Village Vanguard"
+        assert get_venue_info("Blue Note", self.VENUES) is None
+
+    def test_punctuation_and_spacing_ignored(self):
+        assert fuzzy_venue_key(("village  vanguard!",), tuple(self.VENUES)) == "Village Vanguard"
+
+    def test_first_overlapping_key_wins(self):
+        # "village vanguard" vs "the village vanguard" scores 88.9, so the
+        # earlier key wins even though the later one is an exact match
+        names = ("The Village Vanguard", "Village Vanguard")
+        assert fuzzy_venue_key(("Village Vanguard",), names) == "The Village Vanguard"
+        assert fuzzy_venue_key(("Village Vanguard",), names[::-1]) == "Village Vanguard"
+        venues = {name: {"neighborhood": name} for name in names}
+        assert get_venue_info("Village Vanguard", venues) == {"neighborhood": "The Village Vanguard"}
+
+    def test_new_config_keys_not_served_from_cache(self):
+        assert get_venue_info("Blue Note", self.VENUES) is None
+        venues = {**self.VENUES, "Blue Note": {"neighborhood": "Greenwich Village"}}
+        assert get_venue_info("Blue Note", venues) == {"neighborhood": "Greenwich Village"}
+
+
+class TestArtistLookup:
+    def test_first_match_in_profile_order(self):
+        names = ("Radiohed", "Radiohead", "Portishead")
+        assert fuzzy_artist_key("RADIOHEAD", names) == "Radiohed"
+
+    def test_known_names_built_once_per_parse(self, tmp_path):
+        path = tmp_path / "taste_profile.yaml"
+        path.write_text("artist_affinities: {IDLES: 0.9, Jon Hopkins: 0.7}\n")
+        profile = load_yaml_cached(str(path))
+        names = known_artist_names(profile, "a", profile["artist_affinities"])
+        assert names == ("IDLES", "Jon Hopkins")
+        assert known_artist_names(profile, "a", profile["artist_affinities"]) is names
+        lowered = lowered_artist_names(profile, "a", names)
+        assert lowered == ["idles", "jon hopkins"]
+        assert lowered_artist_names(profile, "a", names) is lowered
+        assert fuzzy_artist_key("Idles", names, lowered) == "IDLES"
+
+        path.write_text("artist_affinities: {Four Tet: 0.9}\n")
+        profile = load_yaml_cached(str(path))
+        assert known_artist_names(profile, "a", profile["artist_affinities"]) == ("Four Tet",)
+
+    def test_known_names_for_uncached_profile(self):
+        profile = {"artist_affinities": {"IDLES": 0.9}}
+        assert known_artist_names(profile, "a", profile["artist_affinities"]) == ("IDLES",)
+
+    def test_threshold_is_strict(self):
+        # fuzz.ratio of these two is exactly 85.0, which doesn't count as a match
+        assert fuzzy_artist_key("abcdefghijklmnopq", ("abcdefghijklmnopqrstuvw",)) is None
+
+
+class TestEventArtistNames:
+    def test_namedtuple_event(self):
+        class SlimEvent(NamedTuple):
+            entities: tuple
+            venue_name: str = "Village Vanguard"
+
+        ev = SlimEvent(entities=(_artist("IDLES"), FakeEntity("genre", "punk")))
+        assert event_artist_names(ev) == ("IDLES",)
+        assert event_artist_keys(ev) == frozenset({"idles"})
+        assert score_novelty(ev, seen_artists=_SEEN, seen_venues=_EMPTY) == 15
 
 
 class TestSocialScore:
-    def setup_method(self):
-        self.prefs = load_preferences()
-        self.venues = load_venues()
-
-    def test_date_friendly_bonus(self):
-        ev = _make_event(venue_name="Village Vanguard")
-        score = score_social(ev, self.prefs, self.venues)
-        assert score >= 15  # date-friendly + seated + intimate
-
-    def test_unknown_venue_baseline(self):
-        ev = _make_event(venue_name="Random Bar")
-        score = score_social(ev, self.prefs, self.venues)
-        assert 8 <= score <= 12
+    @pytest.mark.parametrize("venue_name, low, high", [
+        ("Village Vanguard", 15, 20),  # date-friendly + seated + intimate
+        ("Random Bar", 8, 12),         # unknown venue baseline
+    ])
+    def test_social_range(self, prefs, venues, venue_name, low, high):
+        ev = _make_event(venue_name=venue_name)
+        assert low <= score_social(ev, prefs, venues) <= high
 
 
 class TestNoveltyScore:
     def test_new_artist(self):
-        entity = MagicMock()
-        entity.entity_type = "artist"
-        entity.entity_value = "New Artist"
+        entity = _artist("New Artist")
 
         ev = _make_event(entities=[entity])
-        score = score_novelty(ev, seen_artists=set(), seen_venues=set())
+        score = score_novelty(ev, seen_artists=_EMPTY, seen_venues=_EMPTY)
         assert score >= 10
 
     def test_seen_artist_lower(self):
-        entity = MagicMock()
-        entity.entity_type = "artist"
-        entity.entity_value = "Repeat Artist"
+        entity = _artist("Repeat Artist")
 
         ev = _make_event(entities=[entity])
-        score_seen = score_novelty(ev, seen_artists={"repeat artist"}, seen_venues=set())
-        score_new = score_novelty(ev, seen_artists=set(), seen_venues=set())
+        score_seen = score_novelty(ev, seen_artists=_SEEN, seen_venues=_EMPTY)
+        score_new = score_novelty(ev, seen_artists=_EMPTY, seen_venues=_EMPTY)
         assert score_seen < score_new
 
 
 class TestConcertHistorySignal:
     """Tests for concert_history_signal scoring."""
 
-    MOCK_PROFILE = {
-        "concert_history": {
-            "artists": {
-                "Makaya McCraven": {"affinity": 0.9, "seen": 3},
-                "IDLES": {"affinity": 0.9, "seen": 3},
-                "Jon Hopkins": {"affinity": 0.7, "seen": 1},
-            },
-        },
-    }
-
-    def _artist_entity(self, name):
-        entity = MagicMock()
-        entity.entity_type = "artist"
-        entity.entity_value = name
-        return entity
+    MAKAYA = _artist("Makaya McCraven")
+    IDLES = _artist("IDLES")
+    HOPKINS = _artist("Jon Hopkins")
 
     @patch("ranking.scorer._load_taste_profile")
-    def test_known_artist_scores_positive(self, mock_profile):
-        mock_profile.return_value = self.MOCK_PROFILE
-        ev = _make_event(entities=[self._artist_entity("Makaya McCraven")])
-        prefs = load_preferences()
-        venues = load_venues()
+    def test_known_artist_scores_positive(self, mock_profile, prefs, venues):
+        mock_profile.return_value = MOCK_PROFILE
+        ev = _make_event(entities=[self.MAKAYA])
         score = concert_history_signal(ev, prefs, venues)
         assert score > 0
         assert score == 9.0  # 0.9 * 10
 
     @patch("ranking.scorer._load_taste_profile")
-    def test_unknown_artist_scores_zero(self, mock_profile):
-        mock_profile.return_value = self.MOCK_PROFILE
-        ev = _make_event(entities=[self._artist_entity("Unknown Artist")])
-        prefs = load_preferences()
-        venues = load_venues()
+    def test_unknown_artist_scores_zero(self, mock_profile, prefs, venues):
+        mock_profile.return_value = MOCK_PROFILE
+        ev = _make_event(entities=[_artist("Unknown Artist")])
         score = concert_history_signal(ev, prefs, venues)
         assert score == 0.0
 
     @patch("ranking.scorer._load_taste_profile")
-    def test_repeat_artist_scores_higher(self, mock_profile):
-        mock_profile.return_value = self.MOCK_PROFILE
-        prefs = load_preferences()
-        venues = load_venues()
+    def test_repeat_artist_scores_higher(self, mock_profile, prefs, venues):
+        mock_profile.return_value = MOCK_PROFILE
 
-        ev_repeat = _make_event(entities=[self._artist_entity("IDLES")])
-        ev_single = _make_event(entities=[self._artist_entity("Jon Hopkins")])
+        ev_repeat = _make_event(entities=[self.IDLES])
+        ev_single = _make_event(entities=[self.HOPKINS])
 
         score_repeat = concert_history_signal(ev_repeat, prefs, venues)
         score_single = concert_history_signal(ev_single, prefs, venues)
         assert score_repeat > score_single  # 0.9 > 0.7
 
     @patch("ranking.scorer._load_taste_profile")
-    def test_no_entities_scores_zero(self, mock_profile):
-        mock_profile.return_value = self.MOCK_PROFILE
+    def test_no_entities_scores_zero(self, mock_profile, prefs, venues):
+        mock_profile.return_value = MOCK_PROFILE
         ev = _make_event(entities=[])
-        prefs = load_preferences()
-        venues = load_venues()
         score = concert_history_signal(ev, prefs, venues)
         assert score == 0.0
 
+    def test_real_profile_parsed_once(self, prefs, venues):
+        _load_taste_profile()
+        with patch("config.yaml.load") as mock_load:
+            concert_history_signal(_make_event(entities=[self.IDLES]), prefs, venues)
+            concert_history_signal(_make_event(entities=[self.HOPKINS]), prefs, venues)
+        mock_load.assert_not_called()
+
 
 class TestConcertMatchReasons:
     """Tests for 'Seen live' match reasons from concert history."""
 
-    TASTE_DATA = {
-        "concert_history": {
-            "artists": {
-                "IDLES": {"affinity": 0.9, "seen": 3},
-                "Jon Hopkins": {"affinity": 0.7, "seen": 1},
-            },
-        },
+    IDLES = _artist("IDLES")
+    HOPKINS = _artist("Jon Hopkins")
+
+    BASE_SIGNALS = {
+        "concert_history": 0.0,
+        "artist_affinity": 0,
+        "venue_reputation": 0,
+        "category_weight": 0,
+        "home_neighborhood": False,
     }
 
-    def _artist_entity(self, name):
-        entity = MagicMock()
-        entity.entity_type = "artist"
-        entity.entity_value = name
-        return entity
-
-    def _mock_open_taste(self, *args, **kwargs):
-        """Return a mock file that yields our test YAML data."""
-        import io
-        import yaml as _yaml
-        content = _yaml.dump(self.TASTE_DATA)
-        return io.StringIO(content)
-
-    @patch("builtins.open")
-    def test_seen_live_in_reasons(self, mock_open):
-        mock_open.side_effect = self._mock_open_taste
-        ev = _make_event(entities=[self._artist_entity("Jon Hopkins")])
-        scores = {
-            "signals": {
-                "concert_history": 7.0,
-                "artist_affinity": 0,
-                "venue_reputation": 0,
-                "category_weight": 0,
-                "home_neighborhood": False,
-            },
-        }
-        reasons = match_reasons(ev, scores, prefs={}, venues={})
+    @patch("ranking.explainer._load_taste_profile")
+    def test_seen_live_in_reasons(self, mock_profile):
+        mock_profile.return_value = MOCK_PROFILE
+        ev = _make_event(entities=[self.HOPKINS])
+        scores = {"signals": {**self.BASE_SIGNALS, "concert_history": 7.0}}
+        reasons = match_reasons(ev, scores)
         assert any("Seen live" in r for r in reasons)
 
-    @patch("builtins.open")
-    def test_seen_live_count_shown(self, mock_open):
-        mock_open.side_effect = self._mock_open_taste
-        ev = _make_event(entities=[self._artist_entity("IDLES")])
-        scores = {
-            "signals": {
-                "concert_history": 9.0,
-                "artist_affinity": 0,
-                "venue_reputation": 0,
-                "category_weight": 0,
-                "home_neighborhood": False,
-            },
-        }
-        reasons = match_reasons(ev, scores, prefs={}, venues={})
+    @patch("ranking.explainer._load_taste_profile")
+    def test_seen_live_count_shown(self, mock_profile):
+        mock_profile.return_value = MOCK_PROFILE
+        ev = _make_event(entities=[self.IDLES])
+        scores = {"signals": {**self.BASE_SIGNALS, "concert_history": 9.0}}
+        reasons = match_reasons(ev, scores)
         assert "Seen live 3x" in reasons
 
 
+class TestTemplateExplanations:
+    def test_bulk_matches_single(self, prefs, venues):
+        events = [
+            _make_event(title="Early Set", start_dt=datetime(2025, 3, 12, 19, 0)),
+            _make_event(title="Late Set", start_dt=datetime(2025, 3, 12, 22, 0)),
+            _make_event(title="Elsewhere", venue_name="Random Bar", price_min=None,
+                        neighborhood="Bushwick", category="concert"),
+        ]
+        bulk = explain_templates_bulk(events, prefs, venues)
+        assert bulk == [explain_template(ev, prefs, venues) for ev in events]
+        assert bulk[0] == (
+            "Village Vanguard is a intimate jazz spot in West Village. "
+            "Early Set at 7:00 PM ($25). Right in your neighborhood. Great date spot."
+        )
+
+
+class TestBulkExplanations:
+    def setup_method(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.orig_path = explainer.EXPLANATION_CACHE_PATH
+        explainer.EXPLANATION_CACHE_PATH = os.path.join(self.tmpdir, "explanations.json")
+        explainer._persisted_explanations = None
+        explainer._explanation_cache.clear()
+
+    def teardown_method(self):
+        explainer.EXPLANATION_CACHE_PATH = self.orig_path
+        explainer._persisted_explanations = None
+        explainer._explanation_cache.clear()
+        shutil.rmtree(self.tmpdir)
+
+    @patch("ranking.explainer._llm_provider", return_value="anthropic")
+    @patch("ranking.explainer._llm_complete")
+    def test_one_request_for_batch(self, mock_complete, _provider):
+        mock_complete.return_value = '```json\n["First pick.", "Second pick."]\n```'
+        events = [_make_event(id=101, title="A"), _make_event(id=102, title="B")]
+        assert explain_events(events, prefs={}, venues_config={}) == [
+            "First pick.", "Second pick."]
+        assert mock_complete.call_count == 1
+
+    @patch("ranking.explainer._llm_provider", return_value="anthropic")
+    @patch("ranking.explainer._llm_complete", return_value="not json")
+    def test_bad_reply_falls_back_to_templates(self, _complete, _provider, prefs, venues):
+        events = [_make_event(id=201, title="C"), _make_event(id=202, title="D")]
+        assert explain_events(events, prefs, venues) == explain_templates_bulk(
+            events, prefs, venues)
+
+    @patch("ranking.explainer._llm_provider", return_value="anthropic")
+    @patch("ranking.explainer._llm_complete", return_value="A fine night out.")
+    def test_llm_explanations_reused_by_later_runs(self, mock_complete, _provider):
+        ev = _make_event(id=401, title="Residency", raw_hash="abc")
+        assert explain_events([ev], prefs={}, venues_config={}) == ["A fine night out."]
+
+        # A fresh process starts with empty in-memory caches
+        explainer._persisted_explanations = None
+        explainer._explanation_cache.clear()
+        assert explain_events([ev], prefs={}, venues_config={}) == ["A fine night out."]
+        assert mock_complete.call_count == 1
+
+        # Changed event details get a new explanation
+        changed = _make_event(id=401, title="Residency", raw_hash="def")
+        explain_events([changed], prefs={}, venues_config={})
+        assert mock_complete.call_count == 2
+
+    def test_malformed_persisted_entries_skipped(self):
+        with open(explainer.EXPLANATION_CACHE_PATH, "w") as f:
+            json.dump({"good": ["Kept.", time.time()], "short": ["No timestamp"],
+                       "bad": "text", "worse": None}, f)
+        assert explainer._load_persisted_explanations() == {"good": ["Kept.", ANY]}
+
+    @patch("ranking.explainer.LLM_BATCH_SIZE", 2)
+    @patch("ranking.explainer.explain_llm_bulk")
+    def test_large_batch_split_into_chunks(self, mock_bulk):
+        mock_bulk.side_effect = lambda events, *_: [f"Pick {e.id}." for e in events]
+        events = [_make_event(id=300 + i, title=f"E{i}") for i in range(5)]
+        assert explain_events(events, prefs={}, venues_config={}) == [
+            f"Pick {300 + i}." for i in range(5)]
+        assert sorted(len(call.args[0]) for call in mock_bulk.call_args_list) == [1, 2, 2]
+
+
+class TestSharedScoringPass:
+    def _events(self):
+        artist = _artist("Bill Frisell")
+        return [
+            _make_event(id=1, venue_name="Village Vanguard", entities=[artist],
+                        start_dt=datetime(2025, 3, 12, 20, 30)),
+            _make_event(id=2, venue_name="Village Vanguard", entities=[artist],
+                        start_dt=datetime(2025, 3, 20, 20, 30)),
+        ]
+
+    def test_cached_scores_match_fresh_scores(self, prefs, venues):
+        events = self._events()
+        cache = {}
+        score_and_rank(events, prefs, venues, score_cache=cache)
+
+        # A later window without the first event: the repeat artist/venue is novel again
+        with patch("ranking.selector.score_event") as mock_score:
+            cached = score_and_rank(events[1:], prefs, venues, score_cache=cache)
+            assert mock_score.call_count == 0
+        fresh = score_and_rank(events[1:], prefs, venues)
+        assert [s for _, s in cached] == [s for _, s in fresh]
+
+        boosted = score_and_rank(events, prefs, venues, novelty_boost=3.0, score_cache=cache)
+        fresh_boosted = score_and_rank(events, prefs, venues, novelty_boost=3.0)
+        assert [s for _, s in boosted] == [s for _, s in fresh_boosted]
+
+    def test_cached_total_uses_unrounded_taste(self, prefs, venues):
+        # round(2.45, 1) is 2.5, but round(2.45 + 15, 1) is 17.4
+        events = self._events()
+        cache = {}
+        with patch("ranking.scorer.TASTE_SIGNALS", [lambda event, prefs, venues: 2.45]):
+            score_and_rank(events, prefs, venues, score_cache=cache)
+            cached = score_and_rank(events[1:], prefs, venues, score_cache=cache)
+            fresh = score_and_rank(events[1:], prefs, venues)
+        assert cached[0][1]["total"] == fresh[0][1]["total"] == 17.4
+
+
+class TestSelectAll:
+    def setup_method(self):
+        init_db(":memory:")
+
+    def teardown_method(self):
+        db.close()
+
+    def test_offset_aware_start_dt(self):
+        """Rows with a UTC offset (stored as text) still land in their windows."""
+        src = Source.create(name="test", type="ics", url="https://example.com")
+        soon = datetime.now() + timedelta(hours=3)
+        Event.create(source=src, source_event_id="naive", title="Naive Night",
+                     venue_name="Village Vanguard", start_dt=soon)
+        Event.create(source=src, source_event_id="aware", title="Aware Night",
+                     venue_name="Village Vanguard",
+                     start_dt=soon.replace(tzinfo=timezone.utc))
+
+        with patch("ranking.selector.score_event",
+                   return_value={"total": 50.0, "taste": 50.0, "novelty": 0.0,
+                                 "convenience": 0, "social": 0}):
+            digest = select_all()
+        assert {ev.title for ev, _ in digest["tonight"]} == {"Naive Night", "Aware Night"}
+
+
+class TestSplitRadar:
+    SIGNAL = {"signals": {"artist_affinity": 5.0}}
+    NO_SIGNAL = {"signals": {}}
+
+    def test_radar_chronological_lucky_dip_keeps_order(self):
+        late = _make_event(start_dt=datetime(2025, 3, 20, 20, 0))
+        early = _make_event(start_dt=datetime(2025, 3, 12, 19, 0))
+        other = _make_event()
+        radar, lucky = split_radar_and_lucky_dip(
+            [(late, self.SIGNAL), (other, self.NO_SIGNAL), (early, self.SIGNAL)])
+        assert [ev for ev, _ in radar] == [early, late]
+        assert [ev for ev, _ in lucky] == [other]
+
+    def test_unparsed_string_dates_still_sort(self):
+        dated = _make_event(start_dt=datetime(2025, 3, 20, 20, 0))
+        raw = _make_event(start_dt="2025-03-12 19:00:00-04:00")
+        radar, _ = split_radar_and_lucky_dip([(dated, self.SIGNAL), (raw, self.SIGNAL)])
+        assert [ev for ev, _ in radar] == [raw, dated]
+
+
 class TestOverallScoring:
-    def test_ideal_event_scores_above_threshold(self):
+    def test_ideal_event_scores_above_threshold(self, prefs, venues):
         """A jazz event at the Vanguard on a weeknight should easily pass min_score."""
-        prefs = load_preferences()
-        venues = load_venues()
         ev = _make_event(
             venue_name="Village Vanguard",
             category="jazz",
             start_dt=datetime(2025, 3, 12, 20, 30),
         )
-        taste = score_taste(ev, prefs, venues)
-        conv = score_convenience(ev, prefs, venues)
-        social = score_social(ev, prefs, venues)
-        novelty = score_novelty(ev)
-        total = taste + conv + social + novelty
+        total = combined_score(ev, prefs, venues)
         min_score = prefs.get("selection", {}).get("min_score", 25)
         assert total >= min_score
+
+    def test_combined_matches_sum_of_parts(self, prefs, venues):
+        ev = _make_event(venue_name="Village Vanguard (Main Room)")
+        parts = (score_taste(ev, prefs, venues) + score_convenience(ev, prefs, venues)
+                 + score_social(ev, prefs, venues) + score_novelty(ev))
+        assert combined_score(ev, prefs, venues) == parts
@@ -0,0 +1,196 @@
+"""Tests for HTML scrape adapter helpers."""
+import os
+import json
+import tempfile
+import shutil
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+from bs4 import BeautifulSoup
+
+from ingestion import fetcher
+from ingestion.scrape_adapter import ScrapeAdapter
+from ingestion.sources import poster_house, smalls, village_vanguard
+
+
+BLOCK_HTML = """
+<div class="event-card">
+  <a>no href</a>
+  <div class="event-meta">
+    <span class="show-time">8:00 PM</span>
+    <time datetime="2026-03-15T20:00:00">Mar 15</time>
+    <span class="tag">Talk</span>
+    <span class="ticket-price">$20</span>
+  </div>
+  <div class="artist-name">Brad Mehldau</div>
+  <h3 class="event-title">Brad Mehldau Trio</h3>
+  <p class="excerpt">An evening of piano trio.</p>
+  <div class="event-description">Longer copy.</div>
+  <a href="/events/mehldau">Tickets</a>
+</div>
+"""
+
+# The selector lists each adapter used before single-pass scanning
+SELECTORS = {
+    poster_house.Adapter: {
+        "title": "h2, h3, h4, .title, [class*='title']",
+        "date": ".date, time, [class*='date'], [class*='time']",
+        "type": ".event-type, .category, .tag, [class*='type'], [class*='category']",
+        "description": "p, .excerpt, .description, [class*='desc']",
+        "link": "a[href]",
+    },
+    smalls.Adapter: {
+        "title": ("h2, h3, h4, .event-title, .show-title, .artist-name, "
+                  "[class*='title'], [class*='artist']"),
+        "date": ".date, .event-date, time, [class*='date']",
+        "time": "[class*='time']",
+        "price": "[class*='price'], .price",
+        "link": "a[href]",
+    },
+    village_vanguard.Adapter: {
+        "title": "h2, h3, h4, .title, .event-title, .artist",
+        "date": ".date, .event-date, time",
+        "description": ".description, .event-description, p",
+        "link": "a[href]",
+    },
+}
+
+
+class TestScanFields:
+    def test_matches_select_one(self):
+        block = BeautifulSoup(BLOCK_HTML, "html.parser").select_one(".event-card")
+        for adapter_cls, selectors in SELECTORS.items():
+            fields = ScrapeAdapter.scan_fields(block, adapter_cls.FIELD_RULES)
+            assert set(fields) <= set(selectors)
+            for field, selector in selectors.items():
+                assert fields.get(field) is block.select_one(selector), (
+                    adapter_cls.__module__, field)
+
+    def test_missing_fields_absent(self):
+        block = BeautifulSoup("<div><span>Nothing here</span></div>", "html.parser").div
+        fields = ScrapeAdapter.scan_fields(block, poster_house.Adapter.FIELD_RULES)
+        assert fields == {}
+
+    def test_block_itself_not_matched(self):
+        block = BeautifulSoup('<h2 class="title">Heading</h2>', "html.parser").h2
+        fields = ScrapeAdapter.scan_fields(block, village_vanguard.Adapter.FIELD_RULES)
+        assert "title" not in fields
+
+
+class TestSelectFirstTier:
+    PAGE = """
+    <main>
+      <article class="post"><h2>Not a card</h2></article>
+      <div class="card"><div class="event-title">Card one</div></div>
+      <div class="event-card"><div class="event-title">Card two</div></div>
+    </main>
+    """
+
+    def _or_chain(self, soup, tiers):
+        for tier in tiers:
+            hits = soup.select(tier)
+            if hits:
+                return hits
+        return []
+
+    def test_matches_or_chain(self):
+        soup = BeautifulSoup(self.PAGE, "html.parser")
+        for adapter_cls in (poster_house.Adapter, smalls.Adapter, village_vanguard.Adapter):
+            tiers = adapter_cls.BLOCK_SELECTORS
+            assert ScrapeAdapter.select_first_tier(soup, tiers) == self._or_chain(soup, tiers)
+
+    def test_falls_through_to_later_tier(self):
+        soup = BeautifulSoup("<div class='card'>A</div><div class='card'>B</div>", "html.parser")
+        blocks = ScrapeAdapter.select_first_tier(soup, poster_house.Adapter.BLOCK_SELECTORS)
+        assert [b.get_text() for b in blocks] == ["A", "B"]
+
+    def test_no_matches(self):
+        soup = BeautifulSoup("<p>Nothing</p>", "html.parser")
+        assert ScrapeAdapter.select_first_tier(soup, smalls.Adapter.BLOCK_SELECTORS) == []
+
+
+class TestJsHostRouting:
+    """Static fetch first; hosts whose HTML is an empty shell switch to the browser."""
+
+    SHELL_HTML = "<html><body><div id='app'></div></body></html>"
+    RENDERED_HTML = (
+        "<div class='event-card'><h3>Late Set</h3>"
+        "<time datetime='2026-03-15T22:00:00'>Mar 15</time></div>"
+    )
+
+    def setup_method(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.orig_path = fetcher.JS_HOSTS_PATH
+        fetcher.JS_HOSTS_PATH = os.path.join(self.tmpdir, "js_hosts.json")
+        fetcher._js_hosts = None
+
+    def teardown_method(self):
+        fetcher.JS_HOSTS_PATH = self.orig_path
+        fetcher._js_hosts = None
+        shutil.rmtree(self.tmpdir)
+
+    def _adapter(self):
+        return smalls.Adapter({"name": "smalls", "url": "https://www.smallslive.com/tickets/"})
+
+    def test_empty_shell_retries_with_browser(self):
+        resp = MagicMock(text=self.SHELL_HTML)
+        with patch("ingestion.fetcher.requests.get", return_value=resp) as mock_get, \
+                patch("ingestion.playwright_adapter.fetch_with_playwright",
+                      return_value=self.RENDERED_HTML) as mock_browser:
+            events, _ = self._adapter().run()
+            assert [e["title"] for e in events] == ["Late Set"]
+            assert mock_get.call_count == 1
+            assert mock_browser.call_count == 1
+
+            # Decision is persisted, so the next run goes straight to the browser
+            fetcher._js_hosts = None
+            self._adapter().run()
+            assert mock_get.call_count == 1
+            assert mock_browser.call_count == 2
+
+        with open(fetcher.JS_HOSTS_PATH) as f:
+            assert list(json.load(f)) == ["www.smallslive.com"]
+
+    def test_empty_rendered_page_unmarks_host(self):
+        resp = MagicMock(text=self.SHELL_HTML)
+        with patch("ingestion.fetcher.requests.get", return_value=resp), \
+                patch("ingestion.playwright_adapter.fetch_with_playwright",
+                      return_value=self.SHELL_HTML) as mock_browser:
+            events, _ = self._adapter().run()
+        assert events == []
+        assert mock_browser.call_count == 1
+        assert not fetcher.needs_js("https://www.smallslive.com/tickets/")
+        with open(fetcher.JS_HOSTS_PATH) as f:
+            assert json.load(f) == {}
+
+    def test_failed_browser_retry_unmarks_host(self):
+        resp = MagicMock(text=self.SHELL_HTML)
+        with patch("ingestion.fetcher.requests.get", return_value=resp), \
+                patch("ingestion.playwright_adapter.fetch_with_playwright",
+                      side_effect=RuntimeError("browser crashed")):
+            with pytest.raises(RuntimeError):
+                self._adapter().run()
+        assert not fetcher.needs_js("https://www.smallslive.com/tickets/")
+        with open(fetcher.JS_HOSTS_PATH) as f:
+            assert json.load(f) == {}
+
+    def test_expired_mark_reprobes_static(self):
+        with open(fetcher.JS_HOSTS_PATH, "w") as f:
+            json.dump({"www.smallslive.com": time.time() - fetcher.JS_HOST_TTL - 1}, f)
+        resp = MagicMock(text="<html>" + self.RENDERED_HTML + "</html>")
+        with patch("ingestion.fetcher.requests.get", return_value=resp) as mock_get, \
+                patch("ingestion.playwright_adapter.fetch_with_playwright") as mock_browser:
+            events, _ = self._adapter().run()
+        assert [e["title"] for e in events] == ["Late Set"]
+        assert mock_get.call_count == 1
+        assert mock_browser.call_count == 0
+
+    def test_large_static_page_not_marked(self):
+        resp = MagicMock(text="<html>" + "x" * fetcher.JS_SHELL_MAX_CHARS + "</html>")
+        with patch("ingestion.fetcher.requests.get", return_value=resp), \
+                patch("ingestion.playwright_adapter.fetch_with_playwright") as mock_browser:
+            events, _ = self._adapter().run()
+        assert events == []
+        assert mock_browser.call_count == 0
+        assert not os.path.exists(fetcher.JS_HOSTS_PATH)